@@ -1,11 +1,21 @@
 import os
+import sys
 import glob
 import re
+import json
+import time
+import hashlib
+import functools
 import concurrent.futures
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from io import BytesIO
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import defaultdict
 from colorama import init, Fore, Style
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urlunparse, urljoin
+from html import unescape
 
 # Initialize colorama
 init(autoreset=True)
@@ -13,6 +23,110 @@ init(autoreset=True)
 # Configuration
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 INDEX_FILE = os.path.join(ROOT_DIR, 'index.html')
+ROOT_PREFIX = os.path.join(ROOT_DIR, '') # ROOT_DIR with trailing separator, for cheap concatenation
+HTML_PARSER = 'lxml' # C-backed libxml2 parser, much faster than 'html.parser'
+EXTERNAL_CHECK_CONCURRENCY = 100 # Max in-flight requests on the external-link event loop
+EXTERNAL_CHECK_TIMEOUT = 5 # Seconds per URL
+HEAD_NOT_ALLOWED = (405, 501) # Servers that reject HEAD get a streamed GET instead
+CACHE_FILE = os.path.join(ROOT_DIR, '.audit_cache.json')
+URL_CACHE_TTL = 24 * 3600 # Successful external checks are trusted for a day
+CONFIG_STRAINER = SoupStrainer(['link', 'meta']) # Site config only lives in these head tags
+HEAD_END_RE = re.compile(r'</head\s*>', re.I)
+PAGE_CACHE_VERSION = 2 # Bump when scan_semantics/scan_links output changes to invalidate cached page facts
+MIN_HTML_BYTES = 256 # Smaller .html files are reported as empty instead of parsed
+HTML_SNIFF_BYTES = 512 # Leading bytes checked for <!DOCTYPE / <html before a file is audited
+PROGRESS_EVERY = 1000 # Files between progress lines during the per-file audit
+
+# Link scanner: comments and <script>/<style> bodies are matched (and skipped) so that
+# anchors inside JS templates are not mistaken for real links.
+A_TAG_RE = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>|<a\s((?:"[^"]*"|\'[^\']*\'|[^\'">])*)>', re.I | re.S)
+ATTR_RE = re.compile(r'([^\s"\'>/=]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+
+# Semantics scanner over raw bytes: comments and <script>/<style> bodies are consumed whole
+# so an <h1> inside them is not counted; <script> attributes are captured to spot JSON-LD.
+SEMANTICS_RE = re.compile(rb'<!--.*?-->|<script\b([^>]*)>.*?</script\s*>|<style\b.*?</style\s*>|<h1[\s>]', re.I | re.S)
+LDJSON_TYPE_RE = re.compile(rb'(?:^|\s)(?i:type)\s*=\s*["\']?application/ld\+json(?:["\'\s]|$)')
+
+def scan_links(content):
+    """Yields (href, rel_list) for every <a href> in raw HTML without building a tree."""
+    for m in A_TAG_RE.finditer(content):
+        attrs_str = m.group(2)
+        if attrs_str is None:
+            continue
+        attrs = {}
+        for name, dq, sq, bare in ATTR_RE.findall(attrs_str):
+            attrs.setdefault(name.lower(), dq or sq or bare)
+        if 'href' in attrs:
+            yield unescape(attrs['href']), unescape(attrs.get('rel', '')).split()
+
+def strip_query_fragment(href):
+    """Cuts href at the first '#' or '?' using str.find (no intermediate split lists)."""
+    end = href.find('#')
+    q = href.find('?', 0, end if end != -1 else len(href))
+    if q != -1:
+        end = q
+    return href if end == -1 else href[:end]
+
+@functools.lru_cache(maxsize=None)
+def source_dir_of(source_path):
+    """Absolute directory of a ROOT-relative page (one join per page instead of per link)."""
+    return os.path.dirname(ROOT_PREFIX + source_path)
+
+def scan_semantics(raw):
+    """
+    Returns (h1_count, has_schema) from raw HTML bytes with string-level matching only.
+    Only 0 / 1 / many <h1> matters, so h1_count stops at 2 and scanning ends early
+    once nothing else can change the result.
+    """
+    h1_count = 0
+    has_schema = False
+    for m in SEMANTICS_RE.finditer(raw):
+        if m.group(1) is not None:
+            has_schema = has_schema or LDJSON_TYPE_RE.search(m.group(1)) is not None
+        elif m.group(0)[:3].lower() == b'<h1':
+            h1_count = min(h1_count + 1, 2)
+        if h1_count > 1 and has_schema:
+            break
+    return h1_count, has_schema
+
+def stream_links(raw):
+    """
+    Fallback link extraction: streams raw HTML bytes through lxml's incremental parser,
+    clearing each <a> as it closes so the tree is never held in memory.
+    Returns (href, rel_list) pairs.
+    """
+    links = []
+    try:
+        for _, elem in etree.iterparse(BytesIO(raw), events=('end',), tag='a', html=True, encoding='utf-8'):
+            if elem.get('href') is not None:
+                links.append((elem.get('href'), elem.get('rel', '').split()))
+            elem.clear()
+    except etree.XMLSyntaxError:
+        pass # Empty or unparseable document: report whatever was seen
+    return links
+
+def normalize_url(url):
+    """Cache key for external URLs: lowercase scheme/host, fragment dropped."""
+    parts = urlparse(url)
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.params, parts.query, ''))
+
+def load_cache():
+    """Loads the persistent audit cache; a missing or corrupt file just means a cold run."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_cache(cache):
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"{Fore.YELLOW}[WARN] Could not write audit cache: {e}{Style.RESET_ALL}")
 
 class AuditConfig:
     def __init__(self):
@@ -21,6 +135,10 @@ class AuditConfig:
         self.ignore_paths = ['.git', 'node_modules', '__pycache__', '.DS_Store', 'MasterTool']
         self.ignore_urls = ['/go/', 'cdn-cgi', 'javascript:', 'mailto:', 'tel:'] # Removed '#'
         self.ignore_files = ['google', '404.html']
+        # Single-pass alternations of the substrings above
+        self._ignore_path_re = re.compile('|'.join(map(re.escape, self.ignore_paths)))
+        self._ignore_file_re = re.compile('|'.join(map(re.escape, self.ignore_files)))
+        self._ignore_url_re = re.compile('|'.join(map(re.escape, self.ignore_urls)))
         self._load_from_index()
 
     def _load_from_index(self):
@@ -30,7 +148,12 @@ class AuditConfig:
 
         try:
             with open(INDEX_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                soup = BeautifulSoup(f, 'html.parser')
+                content = f.read()
+                # Config only lives in <head>: drop the body before parsing and keep only <link>/<meta>
+                head_end = HEAD_END_RE.search(content)
+                if head_end:
+                    content = content[:head_end.end()]
+                soup = BeautifulSoup(content, HTML_PARSER, parse_only=CONFIG_STRAINER)
                 
                 # Base URL
                 canonical = soup.find('link', rel='canonical')
@@ -52,19 +175,19 @@ class AuditConfig:
             print(f"{Fore.RED}[ERROR] Failed to parse index.html config: {e}{Style.RESET_ALL}")
 
     def should_ignore_path(self, path):
-        return any(ignore in path for ignore in self.ignore_paths)
+        return bool(self._ignore_path_re.search(path))
 
     def should_ignore_file(self, filename):
-        return any(ignore in filename for ignore in self.ignore_files)
+        return bool(self._ignore_file_re.search(filename))
 
     def should_ignore_url(self, url):
-        return any(url.startswith(ignore) or ignore in url for ignore in self.ignore_urls)
+        return bool(self._ignore_url_re.search(url))
 
 class SEOAuditor:
     def __init__(self, config):
         self.config = config
         self.files = []
-        self.internal_links = {} # target -> [sources]
+        self.internal_links = defaultdict(list) # target -> [sources]
         self.external_links = set()
         self.score = 100
         self.issues = []
@@ -76,32 +199,86 @@ class SEOAuditor:
         self.clean_url_issues_count = 0
         self.page_outbound_counts = {} # source -> count
 
+        # Filesystem snapshot (built in scan_files) so link checks avoid per-link stat() calls;
+        # a miss (ignored or symlinked dirs, case-insensitive filesystems) is checked on disk
+        self.site_files = set() # ROOT-relative paths of every file
+        self.index_dirs = set() # ROOT-relative dirs containing index.html ('.' is the root)
+
+        # Persistent cache (.audit_cache.json), loaded by main()
+        self.cache = {}
+        self.page_cache = {} # sha256 -> page facts from the previous run
+        self.page_facts = {} # sha256 -> page facts seen this run (written back to the cache)
+
     def scan_files(self):
         print(f"{Fore.CYAN}[INFO] Scanning files...{Style.RESET_ALL}")
-        for root, dirs, files in os.walk(ROOT_DIR):
-            # Ignore directories
-            dirs[:] = [d for d in dirs if not self.config.should_ignore_path(os.path.join(root, d))]
-            
-            for file in files:
-                if file.endswith('.html') and not self.config.should_ignore_file(file):
-                    self.files.append(os.path.join(root, file))
+        self._scan_dir(ROOT_DIR, '.')
         print(f"{Fore.GREEN}[SUCCESS] Found {len(self.files)} HTML files.{Style.RESET_ALL}")
 
+    def _scan_dir(self, path, rel_dir):
+        """Walks the tree with os.scandir, whose DirEntry already knows file vs dir (no extra stat)."""
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                rel = entry.name if rel_dir == '.' else os.path.join(rel_dir, entry.name)
+                if entry.is_dir():
+                    # Ignore directories; symlinked ones are not descended into (like os.walk)
+                    if not (self.config.should_ignore_path(entry.name) or entry.is_symlink()):
+                        subdirs.append((entry.path, rel))
+                    continue
+                if not entry.is_file():
+                    continue # Dangling symlink or special file: nothing a link could resolve to
+
+                self.site_files.add(rel)
+                if entry.name == 'index.html':
+                    self.index_dirs.add(rel_dir)
+                if entry.name.endswith('.html') and not self.config.should_ignore_file(entry.name):
+                    if self._is_auditable(entry, rel):
+                        self.files.append(entry.path)
+
+        # Same top-down order as os.walk: a directory's files before its subdirectories
+        for sub_path, sub_rel in subdirs:
+            self._scan_dir(sub_path, sub_rel)
+
+    def _is_auditable(self, entry, rel):
+        """Cheap pre-parse filter: empty or non-HTML files are reported here and never parsed."""
+        if entry.stat().st_size < MIN_HTML_BYTES:
+            self._add_issue('WARN', "Empty or near-empty HTML file (skipped)", rel, -2)
+            return False
+        with open(entry.path, 'rb') as f:
+            head = f.read(HTML_SNIFF_BYTES).lower()
+        if b'<!doctype' not in head and b'<html' not in head:
+            self._add_issue('WARN', "File does not look like an HTML document (skipped)", rel, -2)
+            return False
+        return True
+
     def audit_file(self, filepath):
-        rel_path = os.path.relpath(filepath, ROOT_DIR)
+        # Interned: this string is stored once per link in internal_links and issues
+        rel_path = sys.intern(os.path.relpath(filepath, ROOT_DIR))
         self.page_outbound_counts[rel_path] = 0
         
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                soup = BeautifulSoup(content, 'html.parser')
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+
+            # Unchanged pages replay the facts extracted on a previous run instead of re-parsing
+            facts = self.page_cache.get(digest)
+            if facts is None:
+                content = raw.decode('utf-8', errors='ignore')
+                # Link Analysis (regex scan, parser only as a fallback)
+                links = list(scan_links(content))
+                if not links:
+                    links = stream_links(raw)
+                h1_count, has_schema = scan_semantics(raw)
+                facts = {'h1_count': h1_count, 'has_schema': has_schema, 'links': links}
+            self.page_facts[digest] = facts
+            h1_count, has_schema, links = facts['h1_count'], facts['has_schema'], facts['links']
 
             # C. Semantics
-            self._check_semantics(soup, rel_path)
+            self._check_semantics(h1_count, has_schema, rel_path)
 
-            # Link Analysis
-            for a in soup.find_all('a', href=True):
-                href = a['href'].strip()
+            for href, rel in links:
+                href = href.strip()
                 if not href or self.config.should_ignore_url(href):
                     continue
                 
@@ -113,13 +290,12 @@ class SEOAuditor:
                         self.internal_links_count += 1
                         self.page_outbound_counts[rel_path] += 1
                         path = href[len(self.config.base_url):]
-                        self._analyze_internal_link(path, rel_path, soup)
+                        self._analyze_internal_link(path, rel_path)
                         self._add_issue('WARN', f"Internal link uses absolute URL: {href}", rel_path, -2)
                     else:
                         self.external_links_count += 1
                         self.external_links.add(href)
                         # Check rel attributes for external links to prevent SEO weight loss
-                        rel = a.get('rel', [])
                         required_rels = ['nofollow', 'noopener', 'noreferrer']
                         missing_rels = [r for r in required_rels if r not in rel]
                         
@@ -130,30 +306,57 @@ class SEOAuditor:
                     self.page_outbound_counts[rel_path] += 1
                     # Internal Link Analysis
                     # Check if internal link accidentally has nofollow (blocking link juice)
-                    rel = a.get('rel', [])
                     if 'nofollow' in rel:
                         self._add_issue('WARN', f"Internal link has 'nofollow' attribute (blocks link juice): {href}", rel_path, -2)
 
-                    self._analyze_internal_link(href, rel_path, soup)
+                    self._analyze_internal_link(href, rel_path)
 
         except Exception as e:
             self._add_issue('ERROR', f"Failed to process file: {e}", rel_path, 0)
 
-    def _check_semantics(self, soup, rel_path):
+    def collect_results(self):
+        """Returns the per-file state gathered by audit_file (used by worker processes)."""
+        return {
+            'issues': self.issues,
+            'penalty': self.score - 100,
+            'internal_links': self.internal_links,
+            'external_links': self.external_links,
+            'page_outbound_counts': self.page_outbound_counts,
+            'total_links_scanned': self.total_links_scanned,
+            'internal_links_count': self.internal_links_count,
+            'external_links_count': self.external_links_count,
+            'clean_url_issues_count': self.clean_url_issues_count,
+            'page_facts': self.page_facts,
+        }
+
+    def merge_results(self, result):
+        """Folds the results of a worker's audit_file run into this auditor."""
+        self.issues.extend(result['issues'])
+        self.score += result['penalty']
+        for target, sources in result['internal_links'].items():
+            self.internal_links[target].extend(sources)
+        self.external_links.update(result['external_links'])
+        self.page_outbound_counts.update(result['page_outbound_counts'])
+        self.total_links_scanned += result['total_links_scanned']
+        self.internal_links_count += result['internal_links_count']
+        self.external_links_count += result['external_links_count']
+        self.clean_url_issues_count += result['clean_url_issues_count']
+        self.page_facts.update(result['page_facts'])
+
+    def _check_semantics(self, h1_count, has_schema, rel_path):
         # H1 Check
-        h1s = soup.find_all('h1')
-        if len(h1s) == 0:
+        if h1_count == 0:
             self._add_issue('ERROR', "Missing <h1> tag", rel_path, -5)
-        elif len(h1s) > 1:
+        elif h1_count > 1:
             self._add_issue('WARN', "Multiple <h1> tags found", rel_path, -2)
 
         # Schema Check
-        schema = soup.find('script', type='application/ld+json')
-        if not schema:
+        if not has_schema:
             self._add_issue('WARN', "Missing Schema (application/ld+json)", rel_path, -2)
 
-    def _analyze_internal_link(self, href, source_path, soup):
+    def _analyze_internal_link(self, href, source_path):
         clean_url_error = False
+        target_path = strip_query_fragment(href)
         
         # Clean URL Check
         if href.endswith('.html') or href.endswith('.htm'):
@@ -183,12 +386,12 @@ class SEOAuditor:
 
         # New Clean URL Checks
         # 3. Uppercase check
-        if any(c.isupper() for c in href.split('?')[0].split('#')[0]):
+        if any(c.isupper() for c in target_path):
             self._add_issue('WARN', f"Link contains uppercase characters (should be lowercase): {href}", source_path, -1)
             clean_url_error = True
 
         # 4. Underscore check
-        if '_' in href.split('?')[0].split('#')[0]:
+        if '_' in target_path:
             self._add_issue('WARN', f"Link contains underscores (should use hyphens): {href}", source_path, -1)
             clean_url_error = True
 
@@ -202,37 +405,23 @@ class SEOAuditor:
 
 
         # Dead Link Check (Local Mapping)
-        # 1. Normalize href to absolute local path
-        target_path = href.split('#')[0].split('?')[0] # Remove fragment/query
-        
+        # 1. Normalize href (already stripped of fragment/query) to absolute local path
         if target_path.startswith('/'):
-            local_target = os.path.join(ROOT_DIR, target_path.lstrip('/'))
+            local_target = ROOT_PREFIX + target_path.lstrip('/')
         else:
             # Handle relative paths for existence check
-            source_dir = os.path.dirname(os.path.join(ROOT_DIR, source_path))
-            local_target = os.path.join(source_dir, target_path)
-        
-        # Check possibilities
-        exists = False
-        is_directory = False
+            local_target = os.path.join(source_dir_of(source_path), target_path)
         
-        # Case 1: Direct file
-        if os.path.isfile(local_target):
-            exists = True
-        # Case 2: .html appended
-        elif os.path.isfile(local_target + '.html'):
-            exists = True
-        # Case 3: index.html inside directory
-        elif os.path.isdir(local_target) and os.path.isfile(os.path.join(local_target, 'index.html')):
-            exists = True
-            is_directory = True
+        # Resolve once: the matched file doubles as the orphan-check key
+        normalized_key, is_directory = self._resolve_target(local_target)
+        exists = normalized_key is not None
             
         if not exists:
             self._add_issue('ERROR', f"Dead link detected: {href}", source_path, -10)
         else:
             # Trailing Slash Check (Context-Aware)
             # Use path without fragment for slash check
-            href_path = href.split('#')[0].split('?')[0]
+            href_path = target_path
             
             # Skip check for pure anchors or empty paths
             if not href_path:
@@ -246,37 +435,88 @@ class SEOAuditor:
 
             # Record for Orphan check (using normalized cleaned path as key)
             # We use the relative path of the target file as the key
-            normalized_key = None
-            if os.path.isfile(local_target):
-                normalized_key = os.path.relpath(local_target, ROOT_DIR)
-            elif os.path.isfile(local_target + '.html'):
-                normalized_key = os.path.relpath(local_target + '.html', ROOT_DIR)
-            elif os.path.isdir(local_target) and os.path.isfile(os.path.join(local_target, 'index.html')):
-                normalized_key = os.path.relpath(os.path.join(local_target, 'index.html'), ROOT_DIR)
-            
             if normalized_key:
-                if normalized_key not in self.internal_links:
-                    self.internal_links[normalized_key] = []
                 self.internal_links[normalized_key].append(source_path)
 
+    def _resolve_target(self, local_target):
+        """
+        Maps a local link target to (ROOT-relative file it serves, is_directory),
+        or (None, False) for a dead link.
+        """
+        # Case 1: Direct file
+        if self._is_site_file(local_target):
+            return sys.intern(os.path.relpath(local_target, ROOT_DIR)), False
+        # Case 2: .html appended
+        if self._is_site_file(local_target + '.html'):
+            return sys.intern(os.path.relpath(local_target + '.html', ROOT_DIR)), False
+        # Case 3: index.html inside directory
+        if self._is_index_dir(local_target):
+            return sys.intern(os.path.relpath(os.path.join(local_target, 'index.html'), ROOT_DIR)), True
+        return None, False
+
+    def _is_site_file(self, local_target):
+        # A trailing slash never names a file (mirrors os.path.isfile)
+        if local_target.endswith('/'):
+            return False
+        if os.path.relpath(local_target, ROOT_DIR) in self.site_files:
+            return True
+        return os.path.isfile(local_target)
+
+    def _is_index_dir(self, local_target):
+        if os.path.relpath(local_target, ROOT_DIR) in self.index_dirs:
+            return True
+        return os.path.isfile(os.path.join(local_target, 'index.html'))
+
     def check_external_links(self):
         print(f"{Fore.CYAN}[INFO] Checking {len(self.external_links)} external links (Async)...{Style.RESET_ALL}")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_url = {executor.submit(self._check_url, url): url for url in self.external_links}
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    code = future.result()
-                    if code >= 400:
-                        self._add_issue('ERROR', f"External dead link ({code}): {url}", "GLOBAL", -5)
-                except Exception as exc:
-                    self._add_issue('WARN', f"External check failed: {url} ({exc})", "GLOBAL", 0)
-
-    def _check_url(self, url):
-        headers = {'User-Agent': 'Mozilla/5.0 (compatible; SEOAuditor/1.0)'}
-        r = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
-        return r.status_code
+        url_cache = self.cache.setdefault('external_urls', {}) # normalized url -> {"status", "checked"}
+        now = time.time()
+
+        # Only hit the network once per normalized URL, and not at all for fresh cached successes
+        key_by_url = {url: normalize_url(url) for url in self.external_links}
+        keys = set(key_by_url.values())
+        status_by_url = {}
+        for key in keys:
+            entry = url_cache.get(key)
+            if entry and now - entry.get('checked', 0) < URL_CACHE_TTL:
+                status_by_url[key] = entry['status']
+        pending = sorted(keys - status_by_url.keys())
+
+        for key, result in zip(pending, asyncio.run(self._check_urls(pending))):
+            status_by_url[key] = result
+            if not isinstance(result, Exception) and result < 400:
+                url_cache[key] = {'status': result, 'checked': now}
+
+        # Report in URL order (external_links is a set, so its iteration order varies per run)
+        for url in sorted(self.external_links):
+            result = status_by_url[key_by_url[url]]
+            if isinstance(result, Exception):
+                self._add_issue('WARN', f"External check failed: {url} ({str(result) or type(result).__name__})", "GLOBAL", 0)
+            elif result >= 400:
+                self._add_issue('ERROR', f"External dead link ({result}): {url}", "GLOBAL", -5)
+
+    async def _check_urls(self, urls):
+        """Checks all URLs on one event loop, bounded by a semaphore. Exceptions are returned, not raised."""
+        semaphore = asyncio.Semaphore(EXTERNAL_CHECK_CONCURRENCY)
+        headers = {'User-Agent': 'Mozilla/5.0 (compatible; SEOAuditor/1.0)', 'Connection': 'keep-alive'}
+        timeout = aiohttp.ClientTimeout(total=EXTERNAL_CHECK_TIMEOUT)
+        # One pooled connector for the whole run: hosts shared by many links reuse TCP/TLS connections
+        connector = aiohttp.TCPConnector(limit=EXTERNAL_CHECK_CONCURRENCY, ttl_dns_cache=300)
+
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector) as session:
+            async def bounded_check(url):
+                async with semaphore:
+                    return await self._check_url(session, url)
+            return await asyncio.gather(*(bounded_check(url) for url in urls), return_exceptions=True)
+
+    async def _check_url(self, session, url):
+        async with session.head(url, allow_redirects=True) as r:
+            if r.status not in HEAD_NOT_ALLOWED:
+                return r.status
+        # Body is never read; leaving the block drops the connection instead of downloading it
+        async with session.get(url, allow_redirects=True) as r:
+            return r.status
 
     def check_orphans(self):
         print(f"{Fore.CYAN}[INFO] Checking for orphan pages...{Style.RESET_ALL}")
@@ -292,14 +532,23 @@ class SEOAuditor:
         self.issues.append({
             'level': level,
             'message': message,
-            'context': context
+            'context': context,
+            'penalty': penalty
         })
         self.score += penalty
-        color = Fore.RED if level == 'ERROR' else Fore.YELLOW
-        print(f"{color}[{level}] {context}: {message} ({penalty}){Style.RESET_ALL}")
+
+    def print_issues(self):
+        """Prints every collected issue in one write (issues are no longer printed as they are found)."""
+        lines = []
+        for issue in self.issues:
+            color = Fore.RED if issue['level'] == 'ERROR' else Fore.YELLOW
+            lines.append(f"{color}[{issue['level']}] {issue['context']}: {issue['message']} ({issue['penalty']}){Style.RESET_ALL}\n")
+        sys.stdout.write(''.join(lines))
+        sys.stdout.flush()
 
     def generate_report(self):
         self.score = max(0, self.score)
+        self.print_issues()
         print("\n" + "="*50)
         print(f"{Fore.WHITE}{Style.BRIGHT}SEO AUDIT REPORT{Style.RESET_ALL}")
         print("="*50)
@@ -361,17 +610,55 @@ class SEOAuditor:
         if self.score < 100:
             print(f"{Fore.CYAN}💡 Suggestion: Run 'python3 build.py' to fix standardization issues.{Style.RESET_ALL}")
 
+# ==========================================
+# Parallel file audit
+# ==========================================
+_worker_context = {}
+
+def _init_worker(context):
+    global _worker_context
+    _worker_context = context
+
+def audit_file_worker(filepath):
+    """Audits one file with a fresh auditor so nothing is shared between processes."""
+    auditor = SEOAuditor(_worker_context['config'])
+    auditor.site_files = _worker_context['site_files']
+    auditor.index_dirs = _worker_context['index_dirs']
+    auditor.page_cache = _worker_context['page_cache']
+    auditor.audit_file(filepath)
+    return auditor.collect_results()
+
 def main():
     config = AuditConfig()
     auditor = SEOAuditor(config)
     
     auditor.scan_files()
+
+    auditor.cache = load_cache()
+    if auditor.cache.get('pages_version') == PAGE_CACHE_VERSION:
+        auditor.page_cache = auditor.cache.get('pages', {})
+    worker_context = {
+        'config': config,
+        'site_files': auditor.site_files,
+        'index_dirs': auditor.index_dirs,
+        'page_cache': auditor.page_cache,
+    }
     
-    for file in auditor.files:
-        auditor.audit_file(file)
+    # Parsing is CPU-bound, so fan files out across processes; map() keeps file order
+    max_workers = max(1, (os.cpu_count() or 2) - 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(worker_context,)) as pool:
+        for done, result in enumerate(pool.map(audit_file_worker, auditor.files, chunksize=8), 1):
+            auditor.merge_results(result)
+            if done % PROGRESS_EVERY == 0:
+                print(f"{Fore.CYAN}[INFO] Audited {done}/{len(auditor.files)} files...{Style.RESET_ALL}")
         
     auditor.check_orphans()
     auditor.check_external_links()
+
+    # Only pages seen this run are kept, so deleted/changed files don't accumulate
+    auditor.cache['pages_version'] = PAGE_CACHE_VERSION
+    auditor.cache['pages'] = auditor.page_facts
+    save_cache(auditor.cache)
     
     auditor.generate_report()
 
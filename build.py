@@ -1,15 +1,23 @@
 import os
-import glob
 import subprocess
-from bs4 import BeautifulSoup
-import sys
+from bs4 import BeautifulSoup, Comment, SoupStrainer
+import lxml.html
+from lxml import etree
+import soupsieve
 import datetime
 import json
 import re
 import hashlib
-import copy
 import math
-import shutil
+import concurrent.futures
+import functools
+from html import escape
+from itertools import repeat
+from operator import itemgetter
+try:
+    import orjson # Optional (pip install orjson): C encoder for the JSON-LD blocks
+except ImportError:
+    orjson = None
 
 # ==========================================
 # Configuration & Constants
@@ -17,6 +25,69 @@ import shutil
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 INDEX_FILE = os.path.join(ROOT_DIR, 'index.html')
 BLOG_DIR = os.path.join(ROOT_DIR, 'blog')
+# Placeholder comments left in the tree for the shared nav/footer; the pre-rendered
+# HTML is spliced into the serialized page instead of being parsed into every soup
+NAV_MARKER = 'build:nav'
+FOOTER_MARKER = 'build:footer'
+BUILD_DATE = datetime.date.today().isoformat() # Fallback date for every page in this run
+# Fallbacks for pages that don't set their own description or tag badge
+DEFAULT_DESCRIPTION = "Cursor VIP Service."
+DEFAULT_KEYWORDS = "cursor, ai, code editor"
+DEFAULT_TAG = "技术干货"
+PRETTY_OUTPUT = os.environ.get('PRETTY', '').lower() in ('1', 'true', 'yes') # Debug aid: indent written pages with prettify()
+# Incremental builds: pages whose inputs and on-disk bytes match the last run are not re-rendered
+CACHE_FILE = os.path.join(ROOT_DIR, '.build_cache.json')
+FULL_BUILD = os.environ.get('FULL_BUILD', '').lower() in ('1', 'true', 'yes') # Ignore the cache and rebuild every page
+HTML_PARSER = 'lxml' # C-backed libxml2 parser (pip install lxml), much faster than 'html.parser'
+# Phase 1 only reads a few fields, so it queries lxml's tree directly: one precompiled
+# XPath union collects all of them in a single walk (see find_page_fields)
+PAGE_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+PAGE_FIELDS_XPATH = etree.XPath(
+    '//title'
+    ' | //meta[@name="description" or @property="article:published_time"]'
+    ' | //script[@type="application/ld+json"]'
+    ' | //*[self::span or self::div][contains(@class, "font-mono") and contains(@class, "rounded-full")]'
+)
+# Precompiled CSS selectors: one tree walk per element instead of several find_all passes.
+# iselect() streams matches where the loop only edits attributes; select() is kept where nodes are removed.
+EXTRACT_STRAINER = SoupStrainer(['nav', 'footer', 'link']) # The only parts of index.html SmartExtractor reads
+LINK_SELECTOR = soupsieve.compile('a[href], img[src], script[src], source[src]')
+FAVICON_SELECTOR = soupsieve.compile('link[rel*="icon" i]') # also matches apple-touch-icon
+# Everything inject_blog_app replaces, gathered in one walk of the page
+BLOG_APP_SELECTOR = soupsieve.compile('#blog-posts-container, #category-nav, #pagination, script')
+# Head resources kept across rebuilds; favicons, canonical and JSON-LD are regenerated
+PRESERVED_HEAD_SELECTOR = soupsieve.compile(
+    'link:not([rel~=canonical]):not([rel*="icon" i]), style, script:not([type="application/ld+json"])'
+)
+# Link prefixes _standardize_links leaves alone
+SKIP_LINK_PREFIXES = ('http', '//', 'mailto:', 'tel:', 'javascript:', 'data:')
+EXTERNAL_LINK_PREFIXES = ('http://', 'https://', '//')
+EXTERNAL_LINK_REL = ('nofollow', 'noopener', 'noreferrer') # Added to off-site <a> tags
+SITE_HOST_RE = re.compile(r'(?:https?:)?//(?:[^/?#@]*\.)?cursor-vip\.pro(?:[:/?#]|$)', re.IGNORECASE) # Absolute links back to this site
+SKIP_RESOURCE_PREFIXES = ('http', '//', '/', 'data:')
+CLEAN_URL_SUFFIX_RE = re.compile(r'(?<=/)index(?:\.html)?$|\.html$') # /blog/index.html -> /blog/, /a.html -> /a
+# Title clean-up applied to every page in extract_page()
+TITLE_SUFFIX = " - Cursor-VIP.pro"
+TITLE_NUMBER_RE = re.compile(r'^\d+[.、\s]*\s*') # "01. " style numbering
+TITLE_YEAR_RE = re.compile(r'\s?202[0-9]\s?')
+
+# Head tags identical on every page, pre-rendered as HTML. reconstruct() slots these
+# groups between the page-specific tags so the head keeps its tag order.
+HEAD_BASIC_HTML = (
+    '<meta charset="utf-8"/>'
+    '<meta name="viewport" content="width=device-width, initial-scale=1"/>'
+)
+HEAD_INDEXING_HTML = (
+    '<meta name="robots" content="index, follow"/>'
+    '<meta http-equiv="content-language" content="zh-cn"/>'
+)
+HEAD_OG_STATIC_HTML = (
+    '<meta property="og:site_name" content="Cursor-VIP.pro"/>'
+    '<meta property="og:image" content="https://cursor-vip.pro/assets/og.png"/>'
+    '<meta property="og:type" content="website"/>'
+)
+HEAD_TWITTER_CARD_HTML = '<meta name="twitter:card" content="summary_large_image"/>'
+HEAD_TWITTER_IMAGE_HTML = '<meta name="twitter:image" content="https://cursor-vip.pro/assets/og.png"/>'
 
 # Tag Mappings: Map granular tags to broader categories
 TAG_MAPPING = {
@@ -39,52 +110,460 @@ ICONS = [
     "fa-keyboard", "fa-sitemap", "fa-bug", "fa-file-code"
 ]
 
+# ==========================================
+# HTML Templates
+# ==========================================
+# Fields are filled with str.format; callers html.escape() every page-derived value
+
+# Breadcrumb for the blog index page
+BREADCRUMB_BLOG_INDEX_HTML = """\
+<nav aria-label="Breadcrumb" class="max-w-7xl mx-auto px-6 mb-8">
+  <ol class="flex items-center space-x-2 text-sm text-slate-400">
+    <li><a href="/" class="hover:text-white transition">首页</a></li>
+    <li><i class="fa-solid fa-chevron-right text-xs opacity-50"></i></li>
+    <li class="text-slate-200 font-medium truncate" aria-current="page">博客</li>
+  </ol>
+</nav>
+"""
+
+# Breadcrumb for a blog post: {title}
+BREADCRUMB_POST_TEMPLATE = """\
+<nav aria-label="Breadcrumb" class="max-w-7xl mx-auto px-6 mb-8">
+  <ol class="flex items-center space-x-2 text-sm text-slate-400">
+    <li><a href="/" class="hover:text-white transition">首页</a></li>
+    <li><i class="fa-solid fa-chevron-right text-xs opacity-50"></i></li>
+    <li><a href="/blog/" class="hover:text-white transition">博客</a></li>
+    <li><i class="fa-solid fa-chevron-right text-xs opacity-50"></i></li>
+    <li class="text-slate-200 font-medium truncate" aria-current="page">{title}</li>
+  </ol>
+</nav>
+"""
+
+# Date/author line under a post title: {date}, {author}
+ARTICLE_META_TEMPLATE = """\
+<div id="article-meta" class="flex items-center justify-center gap-6 text-sm text-slate-400 mt-4 font-mono">
+    <div class="flex items-center gap-2">
+        <i class="fa-regular fa-calendar text-blue-400"></i>
+        <time datetime="{date}">{date}</time>
+    </div>
+    <div class="flex items-center gap-2">
+        <i class="fa-regular fa-user text-purple-400"></i>
+        <span>{author}</span>
+    </div>
+</div>
+"""
+
+# Recommended-reading block: {cards}
+RECOMMENDED_TEMPLATE = """\
+<div id="recommended-reading" class="mt-16 pt-10 border-t border-white/10">
+    <h3 class="text-2xl font-bold text-white mb-8">推荐阅读</h3>
+    <div class="grid grid-cols-1 md:grid-cols-3 gap-6">{cards}</div>
+</div>
+"""
+
+# Recommended-reading card: {url}, {icon}, {tag}, {title}, {date}
+RECOMMENDED_CARD_TEMPLATE = """\
+<a href="{url}" class="block group h-full">
+ <article class="glass-card h-full rounded-xl overflow-hidden flex flex-col bg-[#0B0F19] border border-white/10 hover:border-blue-500/30 transition duration-300">
+  <div class="h-32 bg-slate-900/50 relative overflow-hidden">
+   <div class="absolute inset-0 bg-gradient-to-br from-blue-900/20 to-slate-900"></div>
+   <div class="absolute inset-0 flex items-center justify-center">
+    <i class="fa-solid {icon} text-4xl text-blue-500/20 group-hover:text-blue-500/40 transition duration-500"></i>
+   </div>
+   <div class="absolute top-3 left-3">
+    <span class="px-2 py-0.5 rounded-full bg-blue-500/10 border border-blue-500/10 text-blue-300 text-[10px] font-mono">{tag}</span>
+   </div>
+  </div>
+  <div class="p-4 flex flex-col flex-grow">
+   <h4 class="text-base font-bold text-white mb-2 group-hover:text-blue-400 transition line-clamp-2">{title}</h4>
+   <div class="flex items-center justify-between text-[10px] text-slate-500 mt-auto pt-3 border-t border-white/5">
+    <div class="flex items-center gap-1.5"><i class="fa-regular fa-calendar"></i><span>{date}</span></div>
+    <i class="fa-solid fa-arrow-right group-hover:translate-x-1 transition"></i>
+   </div>
+  </div>
+ </article>
+</a>
+"""
+
+# Blog index card (first page, pre-rendered): {url}, {icon}, {tag}, {title}, {desc}, {date}
+BLOG_CARD_TEMPLATE = """\
+<a href="{url}" class="block group">
+ <article class="glass-card h-full rounded-2xl overflow-hidden flex flex-col">
+  <div class="h-48 bg-slate-900/50 relative overflow-hidden">
+   <div class="absolute inset-0 bg-gradient-to-br from-blue-900/40 to-slate-900"></div>
+   <div class="absolute inset-0 flex items-center justify-center">
+    <i class="fa-solid {icon} text-6xl text-blue-500/20 group-hover:text-blue-500/40 transition duration-500"></i>
+   </div>
+   <div class="absolute top-4 left-4">
+    <span class="px-3 py-1 rounded-full bg-blue-500/20 border border-blue-500/20 text-blue-300 text-xs font-mono">{tag}</span>
+   </div>
+  </div>
+  <div class="p-6 flex flex-col flex-grow">
+   <h2 class="text-xl font-bold text-white mb-3 group-hover:text-blue-400 transition">{title}</h2>
+   <p class="text-sm text-slate-400 leading-relaxed mb-6 flex-grow">{desc}</p>
+   <div class="flex items-center justify-between text-xs text-slate-500 border-t border-white/5 pt-4">
+    <div class="flex items-center gap-2"><i class="fa-regular fa-calendar"></i><span>{date}</span></div>
+    <div class="flex items-center gap-1 group-hover:translate-x-1 transition"><span>阅读全文</span><i class="fa-solid fa-arrow-right"></i></div>
+   </div>
+  </div>
+ </article>
+</a>
+"""
+
+# Home page latest-post card: {url}, {tag}, {date}, {title}, {desc}
+LATEST_POST_CARD_TEMPLATE = """\
+<a href="{url}" class="block group">
+ <article class="glass-card h-full rounded-2xl overflow-hidden flex flex-col bg-[#0B0F19] border border-white/10 hover:border-blue-500/30 transition duration-300">
+  <div class="p-6 flex flex-col flex-grow">
+   <div class="flex items-center justify-between mb-4">
+    <span class="px-3 py-1 rounded-full bg-blue-500/10 border border-blue-500/20 text-blue-400 text-xs font-mono">{tag}</span>
+    <span class="text-xs text-slate-500 font-mono">{date}</span>
+   </div>
+   <h3 class="text-lg font-bold text-white mb-3 group-hover:text-blue-400 transition line-clamp-2">{title}</h3>
+   <p class="text-sm text-slate-400 leading-relaxed mb-6 flex-grow line-clamp-3">{desc}</p>
+   <div class="flex items-center gap-2 text-xs text-slate-500 group-hover:text-blue-400 transition mt-auto">
+    <span>Read Article</span>
+    <i class="fa-solid fa-arrow-right group-hover:translate-x-1 transition-transform"></i>
+   </div>
+  </div>
+ </article>
+</a>
+"""
+
+# Client-side filtering/pagination for the blog index; only the two data literals vary per build.
+# str.format rather than string.Template: the JS template literals use ${...} themselves.
+BLOG_APP_SCRIPT_TEMPLATE = """
+const BLOG_DATA = {blog_data};
+const BLOG_TAGS = {blog_tags};
+
+(function() {{
+    const postsPerPage = 6;
+    let currentPage = 1;
+    let currentCategory = '全部';
+    const container = document.getElementById('blog-posts-container');
+    const catNav = document.getElementById('category-nav');
+    const pagNav = document.getElementById('pagination');
+
+    function initState() {{
+        const params = new URLSearchParams(window.location.search);
+        currentCategory = params.get('category') || '全部';
+        currentPage = parseInt(params.get('page')) || 1;
+        render();
+    }}
+
+    function render() {{
+        const filtered = currentCategory === '全部' ? BLOG_DATA : BLOG_DATA.filter(p => p.tag === currentCategory);
+        const totalPages = Math.ceil(filtered.length / postsPerPage);
+        if (currentPage > totalPages) currentPage = 1;
+        if (currentPage < 1) currentPage = 1;
+
+        const start = (currentPage - 1) * postsPerPage;
+        const pagePosts = filtered.slice(start, start + postsPerPage);
+
+        renderPosts(pagePosts);
+        renderCategories();
+        renderPagination(totalPages);
+
+        const newUrl = new URL(window.location);
+        if (currentCategory !== '全部') newUrl.searchParams.set('category', currentCategory);
+        else newUrl.searchParams.delete('category');
+        if (currentPage > 1) newUrl.searchParams.set('page', currentPage);
+        else newUrl.searchParams.delete('page');
+        window.history.replaceState({{}}, '', newUrl);
+    }}
+
+    function renderPosts(posts) {{
+        if (posts.length === 0) {{
+            container.innerHTML = '<div class="col-span-full text-center text-slate-500 py-20">暂无文章</div>';
+            return;
+        }}
+        container.innerHTML = posts.map(post => `
+            <a href="${{post.url}}" class="block group">
+              <article class="glass-card h-full rounded-2xl overflow-hidden flex flex-col">
+               <div class="h-48 bg-slate-900/50 relative overflow-hidden">
+                <div class="absolute inset-0 bg-gradient-to-br from-blue-900/40 to-slate-900"></div>
+                <div class="absolute inset-0 flex items-center justify-center">
+                 <i class="fa-solid ${{post.icon}} text-6xl text-blue-500/20 group-hover:text-blue-500/40 transition duration-500"></i>
+                </div>
+                <div class="absolute top-4 left-4">
+                 <span class="px-3 py-1 rounded-full bg-blue-500/20 border border-blue-500/20 text-blue-300 text-xs font-mono">${{post.tag}}</span>
+                </div>
+               </div>
+               <div class="p-6 flex flex-col flex-grow">
+                <h2 class="text-xl font-bold text-white mb-3 group-hover:text-blue-400 transition">${{post.title}}</h2>
+                <p class="text-sm text-slate-400 leading-relaxed mb-6 flex-grow">${{post.desc}}</p>
+                <div class="flex items-center justify-between text-xs text-slate-500 border-t border-white/5 pt-4">
+                 <div class="flex items-center gap-2"><i class="fa-regular fa-calendar"></i><span>${{post.date}}</span></div>
+                 <div class="flex items-center gap-1 group-hover:translate-x-1 transition"><span>阅读全文</span><i class="fa-solid fa-arrow-right"></i></div>
+                </div>
+               </div>
+              </article>
+            </a>
+        `).join('');
+    }}
+
+    function renderCategories() {{
+        const allActive = currentCategory === '全部' ? 'bg-blue-600 text-white shadow-lg shadow-blue-500/25' : 'bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5';
+        let html = `<button onclick="window.setCategory('全部')" class="px-4 py-2 rounded-full text-sm font-medium transition ${{allActive}}">全部</button>`;
+        BLOG_TAGS.forEach(tag => {{
+            const isActive = currentCategory === tag;
+            const cls = isActive ? 'bg-blue-600 text-white shadow-lg shadow-blue-500/25' : 'bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5';
+            html += `<button onclick="window.setCategory('${{tag}}')" class="px-4 py-2 rounded-full text-sm font-medium transition ${{cls}}">${{tag}}</button>`;
+        }});
+        catNav.innerHTML = html;
+    }}
+
+    function renderPagination(totalPages) {{
+        if (totalPages <= 1) {{ pagNav.innerHTML = ''; return; }}
+        let html = '';
+        if (currentPage > 1) html += `<button onclick="window.setPage(${{currentPage - 1}})" class="w-10 h-10 flex items-center justify-center rounded-full bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5 transition"><i class="fa-solid fa-chevron-left text-xs"></i></button>`;
+        for (let i = 1; i <= totalPages; i++) {{
+            if (i === 1 || i === totalPages || (i >= currentPage - 1 && i <= currentPage + 1)) {{
+                const isActive = i === currentPage;
+                const cls = isActive ? 'bg-blue-600 text-white shadow-lg shadow-blue-500/25' : 'bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5';
+                html += `<button onclick="window.setPage(${{i}})" class="w-10 h-10 flex items-center justify-center rounded-full text-sm font-medium transition ${{cls}}">${{i}}</button>`;
+            }} else if (i === 2 && currentPage > 3) html += '<span class="w-10 h-10 flex items-center justify-center text-slate-600">...</span>';
+            else if (i === totalPages - 1 && currentPage < totalPages - 2) html += '<span class="w-10 h-10 flex items-center justify-center text-slate-600">...</span>';
+        }}
+        if (currentPage < totalPages) html += `<button onclick="window.setPage(${{currentPage + 1}})" class="w-10 h-10 flex items-center justify-center rounded-full bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5 transition"><i class="fa-solid fa-chevron-right text-xs"></i></button>`;
+        pagNav.innerHTML = html;
+    }}
+
+    window.setCategory = (cat) => {{ currentCategory = cat; currentPage = 1; render(); }};
+    window.setPage = (p) => {{ currentPage = p; render(); document.getElementById('category-nav').scrollIntoView({{ behavior: 'smooth' }}); }};
+
+    initState();
+    window.addEventListener('popstate', initState);
+}})();
+"""
+
 # ==========================================
 # Helper Functions
 # ==========================================
+def load_cache():
+    """Loads the persistent build cache; a missing or corrupt file just means a full rebuild."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_cache(cache):
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"⚠️ Could not write build cache: {e}")
 
-def get_post_date(filepath):
+def build_inputs_digest(layout, blog_posts):
     """
-    Get the original creation date from Git history.
-    Fallback to today if not found.
+    Hashes everything every page's output depends on: this script, the shared layout
+    from index.html and the post list used for listings and recommendations.
+    """
+    h = hashlib.sha256()
+    with open(os.path.abspath(__file__), 'rb') as f:
+        h.update(f.read())
+    h.update(json.dumps([PRETTY_OUTPUT, layout, blog_posts], sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return h.hexdigest()
+
+def page_inputs_digest(build_digest, item):
+    """Combines the site-wide digest with the page's own render job (metadata, dates, type)."""
+    job = {k: v for k, v in item.items() if k != 'digest'}
+    return hashlib.sha256((build_digest + json.dumps(job, sort_keys=True, ensure_ascii=False)).encode('utf-8')).hexdigest()
+
+
+def load_git_dates():
+    """
+    Reads the whole repository history with one `git log` instead of two per page.
+    Returns {path relative to ROOT_DIR: (created, last_modified)}; renames are followed
+    so a moved post keeps its original creation date, like `git log --follow`.
     """
     try:
-        # Get all commit dates for the file (newest first)
-        # --follow handles renames
         result = subprocess.run(
-            ['git', 'log', '--follow', '--format=%ad', '--date=short', filepath],
-            capture_output=True, text=True
+            ['git', '-c', 'core.quotePath=false', 'log', '--format=%x00%ad', '--date=short',
+             '--name-status', '-M', '--relative'],
+            capture_output=True, text=True, cwd=ROOT_DIR
         )
-        lines = result.stdout.strip().split('\n')
-        
-        # The last line is the oldest commit (creation date)
-        if lines and lines[-1]:
-            return lines[-1].strip()
-            
     except Exception as e:
-        print(f"⚠️ Git date extraction failed for {os.path.basename(filepath)}: {e}")
-    
-    return datetime.date.today().isoformat()
+        print(f"⚠️ Git history extraction failed: {e}")
+        return {}
+
+    created = {}
+    modified = {}
+    renamed_to = {} # old path -> current path, filled in while walking back in time
+    date = None
+    # Newest commit first: the first date seen for a path is its last modification,
+    # the last one seen is its creation
+    for line in result.stdout.split('\n'):
+        if line.startswith('\x00'):
+            date = line[1:].strip()
+        elif line and date:
+            fields = line.split('\t')
+            path = fields[-1]
+            current = renamed_to.get(path, path)
+            modified.setdefault(current, date)
+            created[current] = date
+            if fields[0].startswith('R') and len(fields) == 3:
+                renamed_to[fields[1]] = current
+    return {path: (created[path], modified[path]) for path in created}
 
-def get_last_modified_date(filepath):
+def git_head():
+    """Current commit id, used to tell whether cached git dates are still valid."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=ROOT_DIR)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+def write_if_changed(path, data):
+    """Writes data unless the file already holds exactly these bytes, so untouched outputs keep their mtime."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data: return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def parse_date(value):
+    """
+    Parses a page date ("2026-02-03" or a full ISO timestamp). fromisoformat() is far cheaper
+    than strptime() and covers both; strptime() still accepts unpadded dates like "2026-2-3".
+    """
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.datetime.strptime(value, "%Y-%m-%d")
+
+def get_post_date(filepath, git_dates):
+    """
+    Get the original creation date from Git history.
+    Fallback to today if not found.
+    """
+    dates = git_dates.get(os.path.relpath(filepath, ROOT_DIR).replace(os.sep, '/'))
+    return dates[0] if dates else BUILD_DATE
+
+def get_last_modified_date(filepath, git_dates):
     """
     Get the last modification date from Git history.
     Fallback to today if not found.
     """
-    try:
-        # Get latest commit date for the file
-        result = subprocess.run(
-            ['git', 'log', '-n', '1', '--format=%ad', '--date=short', filepath],
-            capture_output=True, text=True
-        )
-        line = result.stdout.strip()
-        if line:
-            return line
-            
-    except Exception as e:
-        print(f"⚠️ Git lastmod extraction failed for {os.path.basename(filepath)}: {e}")
-    
-    return datetime.date.today().isoformat()
+    dates = git_dates.get(os.path.relpath(filepath, ROOT_DIR).replace(os.sep, '/'))
+    return dates[1] if dates else BUILD_DATE
+
+@functools.lru_cache(maxsize=1024)
+def icon_for_title(title):
+    """
+    Picks a stable card icon from the title's MD5. Reads the digest bytes as an int
+    directly instead of round-tripping through hexdigest(); the choice is unchanged.
+    Cached because the same titles recur across every page's cards.
+    """
+    hash_val = int.from_bytes(hashlib.md5(title.encode('utf-8')).digest(), 'big')
+    return ICONS[hash_val % len(ICONS)]
+
+def shorten(text, limit):
+    """Card excerpt: the first `limit` characters plus '...' when the text is longer."""
+    return text[:limit] + '...' if len(text) > limit else text
+
+def parse_page(path, **kwargs):
+    """
+    Parses an HTML file from raw bytes. lxml decodes the UTF-8 itself in C,
+    skipping Python's text-mode decode and the extra str copy.
+    """
+    with open(path, 'rb') as f:
+        return BeautifulSoup(f.read(), HTML_PARSER, from_encoding='utf-8', **kwargs)
+
+def parse_fragment(markup):
+    """
+    Parses an HTML snippet with lxml and returns its first top-level element.
+    lxml wraps snippets in <html><body>, so the element is taken from <body>.
+    """
+    return BeautifulSoup(markup, HTML_PARSER).body.find(True, recursive=False)
+
+def parse_fragments(markup):
+    """Like parse_fragment(), but returns every top-level element, so a run of cards costs one parse."""
+    return BeautifulSoup(markup, HTML_PARSER).body.find_all(True, recursive=False)
+
+def dump_schema(schema):
+    """
+    Serializes a JSON-LD value (or the blog app's inline data) compactly with non-ASCII text kept readable.
+    Uses orjson when installed; the stdlib fallback produces the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(schema).decode('utf-8')
+    return json.dumps(schema, ensure_ascii=False, separators=(',', ':'))
+
+def load_schema(text):
+    """Parses a JSON-LD block, with orjson's decoder when installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# Home page JSON-LD never depends on page metadata, so it is serialized once at import
+WEBSITE_SCHEMA = {
+    "@context": "https://schema.org",
+    "@type": "WebSite",
+    "name": "Cursor-VIP.pro",
+    "url": "https://cursor-vip.pro",
+    "potentialAction": {
+        "@type": "SearchAction",
+        "target": "https://cursor-vip.pro/search?q={search_term_string}",
+        "query-input": "required name=search_term_string"
+    }
+}
+ORGANIZATION_SCHEMA = {
+    "@context": "https://schema.org",
+    "@type": "Organization",
+    "name": "Cursor-VIP",
+    "url": "https://cursor-vip.pro",
+    "logo": "https://cursor-vip.pro/assets/logo.png",
+    "sameAs": ["https://github.com/cursor-vip", "https://twitter.com/cursor_vip"],
+    "contactPoint": {
+        "@type": "ContactPoint",
+        "email": "support@cursor-vip.pro",
+        "contactType": "customer support"
+    }
+}
+HOME_SCHEMA_JSON = (dump_schema(WEBSITE_SCHEMA), dump_schema(ORGANIZATION_SCHEMA))
+
+# Pre-serialized JSON-LD for blog and static pages. Only the page fields vary; they are
+# filled in already JSON-encoded (quoted and escaped) by page_schemas_json().
+BLOG_POSTING_TEMPLATE = (
+    '{{"@context":"https://schema.org","@type":"BlogPosting","headline":{title},"description":{description},'
+    '"mainEntityOfPage":{{"@type":"WebPage","@id":{url}}},'
+    '"author":{{"@type":"Organization","name":"Cursor-VIP Team"}},'
+    '"publisher":{{"@type":"Organization","name":"Cursor-VIP","logo":{{"@type":"ImageObject","url":"https://cursor-vip.pro/logo.svg"}}}},'
+    '"datePublished":{date}}}'
+)
+BLOG_BREADCRUMB_TEMPLATE = (
+    '{{"@context":"https://schema.org","@type":"BreadcrumbList","itemListElement":['
+    '{{"@type":"ListItem","position":1,"name":"首页","item":"https://cursor-vip.pro"}},'
+    '{{"@type":"ListItem","position":2,"name":"博客","item":"https://cursor-vip.pro/blog/"}},'
+    '{{"@type":"ListItem","position":3,"name":{title},"item":{url}}}]}}'
+)
+STATIC_PAGE_TEMPLATE = (
+    '{{"@context":"https://schema.org","@type":"WebPage","name":{title},"description":{description},"url":{url}}}'
+)
+
+def page_schemas_json(metadata):
+    """Returns the serialized JSON-LD blocks for a page, by page type."""
+    page_type = metadata.get('type')
+    if page_type == 'home':
+        return HOME_SCHEMA_JSON
+
+    fields = {
+        'title': dump_schema(metadata.get('title')),
+        'description': dump_schema(metadata.get('description')),
+        'url': dump_schema(metadata.get('url')),
+    }
+    if page_type == 'blog':
+        fields['date'] = dump_schema(metadata.get('date', BUILD_DATE))
+        return (BLOG_POSTING_TEMPLATE.format_map(fields), BLOG_BREADCRUMB_TEMPLATE.format_map(fields))
+    return (STATIC_PAGE_TEMPLATE.format_map(fields),)
 
 # ==========================================
 # Classes
@@ -93,60 +572,68 @@ def get_last_modified_date(filepath):
 class SmartExtractor:
     def __init__(self, index_path):
         self.index_path = index_path
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            self.soup = BeautifulSoup(f, 'html.parser')
+        # Only nav/footer/link subtrees are built into the soup; the rest of the page is skipped
+        self.soup = parse_page(self.index_path, parse_only=EXTRACT_STRAINER)
 
     def get_nav(self):
+        """Returns the standardized <nav> as an HTML string ('' if missing)."""
         nav = self.soup.find('nav')
-        if nav:
-            self._standardize_links(nav, convert_anchors=True)
-            # Ensure logo points to SVG if referenced
-            logo_img = nav.find('img', alt=lambda x: x and 'logo' in x.lower())
-            if logo_img:
-                logo_img['src'] = '/assets/logo.png'
-        return nav
+        if not nav: return ''
+        self._standardize_links(nav, convert_anchors=True)
+        # Ensure logo points to SVG if referenced
+        logo_img = nav.find('img', alt=lambda x: x and 'logo' in x.lower())
+        if logo_img:
+            logo_img['src'] = '/assets/logo.png'
+        return str(nav)
 
     def get_footer(self):
+        """Returns the standardized <footer> as an HTML string ('' if missing)."""
         footer = self.soup.find('footer')
-        if footer:
-            self._standardize_links(footer, convert_anchors=True)
-        return footer
+        if not footer: return ''
+        self._standardize_links(footer, convert_anchors=True)
+        return str(footer)
 
     def get_favicons(self):
-        """Extracts and standardizes favicon links."""
+        """Extracts and standardizes favicon links, returned as one HTML string."""
+        # Tags are rewritten in place and rendered straight away; the index soup is only
+        # used for extraction, so there is no need to copy them first.
         favicons = []
-        icon_tags = self.soup.find_all('link', rel=lambda x: x and ('icon' in x.lower() or 'apple-touch-icon' in x.lower()))
-        
-        for tag in icon_tags:
-            new_tag = tag.__copy__()
-            href = new_tag.get('href')
+        for tag in FAVICON_SELECTOR.iselect(self.soup):
+            href = tag.get('href')
             if href:
                 if href.startswith('data:'):
                     pass
                 elif not href.startswith(('http', '//', '/')):
-                    new_tag['href'] = '/' + href
+                    tag['href'] = '/' + href
                 elif href.startswith('./'):
-                    new_tag['href'] = '/' + href[2:]
-            favicons.append(new_tag)
-        return favicons
+                    tag['href'] = '/' + href[2:]
+            favicons.append(str(tag))
+        return ''.join(favicons)
 
-    def _standardize_links(self, element, convert_anchors=False):
+    @staticmethod
+    def _standardize_links(element, convert_anchors=False):
         """Helper to ensure links and resources in an element are root-relative and clean."""
-        # 1. Standardize Links (a tags)
-        for a in element.find_all('a', href=True):
+        for tag in LINK_SELECTOR.iselect(element):
+            if tag.name != 'a':
+                # Standardize Resources (img src, etc.)
+                src = tag['src']
+                if not src.startswith(SKIP_RESOURCE_PREFIXES):
+                    tag['src'] = '/' + src
+                continue
+
+            # Standardize Links (a tags)
+            a = tag
             href = a['href']
             
             # Skip external/special links
-            if href.startswith(('http', '//', 'mailto:', 'tel:', 'javascript:', 'data:')):
-                if href.startswith(('http://', 'https://', '//')):
-                    if 'cursor-vip.pro' not in href:
+            if href.startswith(SKIP_LINK_PREFIXES):
+                if href.startswith(EXTERNAL_LINK_PREFIXES):
+                    if not SITE_HOST_RE.match(href):
                         rel = a.get('rel', [])
                         if isinstance(rel, str): rel = [rel]
-                        updates = ['nofollow', 'noopener', 'noreferrer']
-                        for u in updates:
-                            if u not in rel:
-                                rel.append(u)
-                        a['rel'] = rel
+                        updates = [u for u in EXTERNAL_LINK_REL if u not in rel]
+                        if updates:
+                            a['rel'] = rel + updates
                 continue
 
             # Handle Anchors
@@ -156,27 +643,19 @@ class SmartExtractor:
                     a['href'] = href
                 continue
 
-            # Clean URL: Remove .html suffix
-            if href.endswith('.html'):
-                href = href[:-5]
-                if not href: href = '/' 
+            # Fast path: already clean and root-relative (every link after the first build)
+            if href.startswith('/') and not href.endswith(('.html', '/index')):
+                continue
+
+            # Clean URL: drop the .html suffix and a trailing index page in one substitution
+            href = CLEAN_URL_SUFFIX_RE.sub('', href)
 
-            # Clean URL: Remove /index suffix
-            if href.endswith('/index'):
-                href = href[:-5]
-            
             # Force Root Relative Path
             if not href.startswith('/'):
                 href = '/' + href
             
             a['href'] = href
 
-        # 2. Standardize Resources (img src, etc.)
-        for tag in element.find_all(['img', 'script', 'source'], src=True):
-            src = tag['src']
-            if not src.startswith(('http', '//', '/', 'data:')):
-                tag['src'] = '/' + src
-
 class HeadReconstructor:
     def __init__(self, soup, metadata, favicons, latest_posts=None):
         self.soup = soup
@@ -191,194 +670,88 @@ class HeadReconstructor:
             self.soup.html.insert(0, head)
         
         # Extract existing CSS/JS to preserve
-        css_js_tags = head.find_all(['link', 'script', 'style'])
-        preserved_resources = []
-        for tag in css_js_tags:
-            is_favicon = tag.name == 'link' and tag.get('rel') and ('icon' in tag.get('rel')[0].lower() or 'apple-touch-icon' in tag.get('rel')[0].lower())
-            is_canonical = tag.name == 'link' and tag.get('rel') and 'canonical' in tag.get('rel')
-            is_json_ld = tag.name == 'script' and tag.get('type') == 'application/ld+json'
-            
-            if not is_favicon and not is_canonical and not is_json_ld:
-                 preserved_resources.append(tag)
+        preserved_resources = PRESERVED_HEAD_SELECTOR.select(head)
 
         head.clear()
 
+        # The whole generated head is rendered as one HTML string and parsed once,
+        # instead of building each tag through new_tag(). Values are escaped here and
+        # unescaped by the parser, so the serialized output is unchanged.
+        md = self.metadata
+        title = escape(md.get('title', 'Cursor Blog'))
+        description = escape(md.get('description') or '')
+        url = escape(md.get('url', ''))
+        keywords, author, date, page_type = md.get('keywords'), md.get('author'), md.get('date'), md.get('type')
+
         # Group A: Basic Metadata
-        head.append(self.soup.new_tag('meta', charset="utf-8"))
-        head.append(self.soup.new_tag('meta', attrs={"name": "viewport", "content": "width=device-width, initial-scale=1"}))
-        
-        title_tag = self.soup.new_tag('title')
-        title_tag.string = self.metadata.get('title', 'Cursor Blog')
-        head.append(title_tag)
+        parts = [HEAD_BASIC_HTML, f'<title>{title}</title>']
         
         # Group B: SEO Core
-        if self.metadata.get('description'):
-            head.append(self.soup.new_tag('meta', attrs={"name": "description", "content": self.metadata.get('description')}))
-        if self.metadata.get('keywords'):
-            head.append(self.soup.new_tag('meta', attrs={"name": "keywords", "content": self.metadata.get('keywords')}))
+        if description:
+            parts.append(f'<meta name="description" content="{description}"/>')
+        if keywords:
+            parts.append(f'<meta name="keywords" content="{escape(keywords)}"/>')
         
-        canonical = self.soup.new_tag('link', rel="canonical", href=self.metadata.get('url', ''))
-        head.append(canonical)
+        parts.append(f'<link rel="canonical" href="{url}"/>')
 
         # Group C: Indexing & Geo
-        head.append(self.soup.new_tag('meta', attrs={"name": "robots", "content": "index, follow"}))
-        head.append(self.soup.new_tag('meta', attrs={"http-equiv": "content-language", "content": "zh-cn"}))
+        parts.append(HEAD_INDEXING_HTML)
 
         # Group C.1: Open Graph / Social
-        head.append(self.soup.new_tag('meta', attrs={"property": "og:title", "content": self.metadata.get('title')}))
-        head.append(self.soup.new_tag('meta', attrs={"property": "og:description", "content": self.metadata.get('description')}))
-        head.append(self.soup.new_tag('meta', attrs={"property": "og:url", "content": self.metadata.get('url')}))
-        head.append(self.soup.new_tag('meta', attrs={"property": "og:site_name", "content": "Cursor-VIP.pro"}))
-        head.append(self.soup.new_tag('meta', attrs={"property": "og:image", "content": "https://cursor-vip.pro/assets/og.png"}))
-        head.append(self.soup.new_tag('meta', attrs={"property": "og:type", "content": "website"}))
+        parts.append(f'<meta property="og:title" content="{title}"/>')
+        parts.append(f'<meta property="og:description" content="{description}"/>')
+        parts.append(f'<meta property="og:url" content="{url}"/>')
+        parts.append(HEAD_OG_STATIC_HTML)
         
-        if self.metadata.get('author'):
-            head.append(self.soup.new_tag('meta', attrs={"name": "author", "content": self.metadata.get('author')}))
-        if self.metadata.get('date') and self.metadata.get('type') == 'blog':
-            head.append(self.soup.new_tag('meta', attrs={"property": "article:published_time", "content": self.metadata.get('date')}))
-
-        head.append(self.soup.new_tag('meta', attrs={"name": "twitter:card", "content": "summary_large_image"}))
-        head.append(self.soup.new_tag('meta', attrs={"name": "twitter:title", "content": self.metadata.get('title')}))
-        head.append(self.soup.new_tag('meta', attrs={"name": "twitter:description", "content": self.metadata.get('description')}))
-        head.append(self.soup.new_tag('meta', attrs={"name": "twitter:image", "content": "https://cursor-vip.pro/assets/og.png"}))
+        if author:
+            parts.append(f'<meta name="author" content="{escape(author)}"/>')
+        if date and page_type == 'blog':
+            parts.append(f'<meta property="article:published_time" content="{escape(date)}"/>')
+
+        parts.append(HEAD_TWITTER_CARD_HTML)
+        parts.append(f'<meta name="twitter:title" content="{title}"/>')
+        parts.append(f'<meta name="twitter:description" content="{description}"/>')
+        parts.append(HEAD_TWITTER_IMAGE_HTML)
         
         # Group D: Branding & Resources
-        for favicon in self.favicons:
-            head.append(favicon)
+        # Favicons arrive as a pre-rendered string and ride along in the same parse
+        parts.append(self.favicons)
+        head.extend(list(BeautifulSoup(''.join(parts), HTML_PARSER).head.contents))
         
-        for res in preserved_resources:
-            head.append(res)
+        head.extend(preserved_resources)
 
         # Group E: Schema
-        schema_gen = SchemaGenerator(self.metadata)
-        schemas = []
-        
-        if self.metadata.get('type') == 'home':
-            schemas = schema_gen.get_home_schema()
-        elif self.metadata.get('type') == 'blog':
-            schemas = schema_gen.get_blog_schema()
-        else:
-            schemas = schema_gen.get_static_page_schema()
-
-        for s in schemas:
-            script_schema = self.soup.new_tag('script', type="application/ld+json")
-            script_schema.string = json.dumps(s, ensure_ascii=False, indent=2)
+        new_tag = self.soup.new_tag
+        for schema_json in page_schemas_json(md):
+            script_schema = new_tag('script', type="application/ld+json")
+            script_schema.string = schema_json
             head.append(script_schema)
 
-class SchemaGenerator:
-    def __init__(self, metadata):
-        self.metadata = metadata
-        self.base_url = "https://cursor-vip.pro"
-
-    def get_home_schema(self):
-        website = {
-            "@context": "https://schema.org",
-            "@type": "WebSite",
-            "name": "Cursor-VIP.pro",
-            "url": self.base_url,
-            "potentialAction": {
-                "@type": "SearchAction",
-                "target": f"{self.base_url}/search?q={{search_term_string}}",
-                "query-input": "required name=search_term_string"
-            }
-        }
-        org = {
-            "@context": "https://schema.org",
-            "@type": "Organization",
-            "name": "Cursor-VIP",
-            "url": self.base_url,
-            "logo": f"{self.base_url}/assets/logo.png",
-            "sameAs": ["https://github.com/cursor-vip", "https://twitter.com/cursor_vip"],
-            "contactPoint": {
-                "@type": "ContactPoint",
-                "email": "support@cursor-vip.pro",
-                "contactType": "customer support"
-            }
-        }
-        return [website, org]
-
-    def get_blog_schema(self):
-        blog_posting = {
-            "@context": "https://schema.org",
-            "@type": "BlogPosting",
-            "headline": self.metadata.get('title'),
-            "description": self.metadata.get('description'),
-            "mainEntityOfPage": {
-                "@type": "WebPage",
-                "@id": self.metadata.get('url')
-            },
-            "author": {
-                "@type": "Organization",
-                "name": "Cursor-VIP Team"
-            },
-            "publisher": {
-                "@type": "Organization",
-                "name": "Cursor-VIP",
-                "logo": {
-                    "@type": "ImageObject",
-                    "url": f"{self.base_url}/logo.svg"
-                }
-            },
-            "datePublished": self.metadata.get('date', datetime.date.today().isoformat())
-        }
-        breadcrumb = {
-            "@context": "https://schema.org",
-            "@type": "BreadcrumbList",
-            "itemListElement": [
-                {
-                    "@type": "ListItem",
-                    "position": 1,
-                    "name": "首页",
-                    "item": self.base_url
-                },
-                {
-                    "@type": "ListItem",
-                    "position": 2,
-                    "name": "博客",
-                    "item": f"{self.base_url}/blog/"
-                },
-                {
-                    "@type": "ListItem",
-                    "position": 3,
-                    "name": self.metadata.get('title'),
-                    "item": self.metadata.get('url')
-                }
-            ]
-        }
-        return [blog_posting, breadcrumb]
-
-    def get_static_page_schema(self):
-        return [{
-            "@context": "https://schema.org",
-            "@type": "WebPage",
-            "name": self.metadata.get('title'),
-            "description": self.metadata.get('description'),
-            "url": self.metadata.get('url')
-        }]
-
 class ContentInjector:
     def __init__(self, soup):
         self.soup = soup
+        self.body = soup.find('body') # Looked up once; nav and footer injection both need it
 
     def _get_icon(self, title):
-        hash_val = int(hashlib.md5(title.encode('utf-8')).hexdigest(), 16)
-        return ICONS[hash_val % len(ICONS)]
+        return icon_for_title(title)
 
     def inject_nav(self, nav_html):
+        """Swaps the page's <nav> for a marker; splice_layout() fills in nav_html after serialization."""
         if not nav_html: return
-        body = self.soup.find('body')
+        body = self.body
         if not body: return
         existing_nav = body.find('nav')
-        if existing_nav: existing_nav.decompose()
-        body.insert(0, nav_html)
+        if existing_nav: existing_nav.extract()
+        body.insert(0, Comment(NAV_MARKER))
 
     def inject_footer(self, footer_html):
+        """Swaps the page's <footer> for a marker; splice_layout() fills in footer_html after serialization."""
         if not footer_html: return
-        body = self.soup.find('body')
+        body = self.body
         if not body: return
         existing_footer = body.find('footer')
-        if existing_footer: existing_footer.decompose()
-        body.append(footer_html)
+        if existing_footer: existing_footer.extract()
+        body.append(Comment(FOOTER_MARKER))
 
     def inject_breadcrumbs(self, title, is_blog_index=False):
         main = self.soup.find('main')
@@ -394,185 +767,101 @@ class ContentInjector:
         if existing_bc: existing_bc.decompose()
             
         if is_blog_index:
-             bc_html = f"""
-            <nav aria-label="Breadcrumb" class="max-w-7xl mx-auto px-6 mb-8">
-              <ol class="flex items-center space-x-2 text-sm text-slate-400">
-                <li><a href="/" class="hover:text-white transition">首页</a></li>
-                <li><i class="fa-solid fa-chevron-right text-xs opacity-50"></i></li>
-                <li class="text-slate-200 font-medium truncate" aria-current="page">博客</li>
-              </ol>
-            </nav>
-            """
+            bc_html = BREADCRUMB_BLOG_INDEX_HTML
         else:
-            bc_html = f"""
-            <nav aria-label="Breadcrumb" class="max-w-7xl mx-auto px-6 mb-8">
-              <ol class="flex items-center space-x-2 text-sm text-slate-400">
-                <li><a href="/" class="hover:text-white transition">首页</a></li>
-                <li><i class="fa-solid fa-chevron-right text-xs opacity-50"></i></li>
-                <li><a href="/blog/" class="hover:text-white transition">博客</a></li>
-                <li><i class="fa-solid fa-chevron-right text-xs opacity-50"></i></li>
-                <li class="text-slate-200 font-medium truncate" aria-current="page">{title}</li>
-              </ol>
-            </nav>
-            """
-        main.insert(0, BeautifulSoup(bc_html, 'html.parser'))
+            bc_html = BREADCRUMB_POST_TEMPLATE.format(title=escape(title))
+        main.insert(0, parse_fragment(bc_html))
 
     def inject_article_meta(self, date, author="Cursor-VIP Team"):
         header = self.soup.find('header')
         if not header: return
         existing_meta = header.find('div', id="article-meta")
         if existing_meta: existing_meta.decompose()
-        meta_html = f"""
-        <div id="article-meta" class="flex items-center justify-center gap-6 text-sm text-slate-400 mt-4 font-mono">
-            <div class="flex items-center gap-2">
-                <i class="fa-regular fa-calendar text-blue-400"></i>
-                <time datetime="{date}">{date}</time>
-            </div>
-            <div class="flex items-center gap-2">
-                <i class="fa-regular fa-user text-purple-400"></i>
-                <span>{author}</span>
-            </div>
-        </div>
-        """
-        header.append(BeautifulSoup(meta_html, 'html.parser'))
-
-    def inject_recommended(self, posts, current_url):
+        meta_html = ARTICLE_META_TEMPLATE.format(date=escape(date), author=escape(author))
+        header.append(parse_fragment(meta_html))
+
+    def inject_recommended(self, blog_posts, current_url):
         article = self.soup.find('article')
         if not article: return
         
-        rec = article.find(id="recommended-reading")
-        if rec: rec.decompose()
-            
-        for h3 in article.find_all('h3'):
-            if "推荐阅读" in h3.get_text():
-                parent = h3.parent
-                if parent.name == 'div': parent.decompose()
-
-        recommendations = [p for p in posts if p['type'] == 'blog' and p['url'] != current_url and not p['url'].endswith('/index') and 'index.html' not in p['url']]
-        recommendations.sort(key=lambda x: x['date'], reverse=True)
-        recommendations = recommendations[:3]
+        # Every page's block carries this id; the legacy hand-written "推荐阅读" divs are long gone
+        existing_rec = article.find(id="recommended-reading")
+        if existing_rec: existing_rec.decompose()
+
+        # blog_posts is already newest-first, so the first three other posts are the picks
+        recommendations = []
+        for post in blog_posts:
+            if post['url'] != current_url:
+                recommendations.append(post)
+                if len(recommendations) == 3: break
         if not recommendations: return
 
-        rec_html = """
-        <div id="recommended-reading" class="mt-16 pt-10 border-t border-white/10">
-            <h3 class="text-2xl font-bold text-white mb-8">推荐阅读</h3>
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-6"></div>
-        </div>
-        """
-        rec_soup = BeautifulSoup(rec_html, 'html.parser')
-        grid_container = rec_soup.find('div', class_="grid")
-        
+        # Cards are rendered as strings and the whole block is parsed once
+        cards = []
         for post in recommendations:
              title = post.get('title', 'Untitled').split(" - ")[0]
-             desc = post.get('description', '')[:40] + '...' if len(post.get('description', '')) > 40 else post.get('description', '')
+             desc = shorten(post.get('description', ''), 40)
              url = post.get('url', '#').replace("https://cursor-vip.pro", "") or "/"
              date = post.get('date', '')
              tag = post.get('tag', 'Tech')
              icon = self._get_icon(title)
              
-             card_html = f"""
-             <a href="{url}" class="block group h-full">
-              <article class="glass-card h-full rounded-xl overflow-hidden flex flex-col bg-[#0B0F19] border border-white/10 hover:border-blue-500/30 transition duration-300">
-               <div class="h-32 bg-slate-900/50 relative overflow-hidden">
-                <div class="absolute inset-0 bg-gradient-to-br from-blue-900/20 to-slate-900"></div>
-                <div class="absolute inset-0 flex items-center justify-center">
-                 <i class="fa-solid {icon} text-4xl text-blue-500/20 group-hover:text-blue-500/40 transition duration-500"></i>
-                </div>
-                <div class="absolute top-3 left-3">
-                 <span class="px-2 py-0.5 rounded-full bg-blue-500/10 border border-blue-500/10 text-blue-300 text-[10px] font-mono">{tag}</span>
-                </div>
-               </div>
-               <div class="p-4 flex flex-col flex-grow">
-                <h4 class="text-base font-bold text-white mb-2 group-hover:text-blue-400 transition line-clamp-2">{title}</h4>
-                <div class="flex items-center justify-between text-[10px] text-slate-500 mt-auto pt-3 border-t border-white/5">
-                 <div class="flex items-center gap-1.5"><i class="fa-regular fa-calendar"></i><span>{date}</span></div>
-                 <i class="fa-solid fa-arrow-right group-hover:translate-x-1 transition"></i>
-                </div>
-               </div>
-              </article>
-             </a>
-             """
-             grid_container.append(BeautifulSoup(card_html, 'html.parser'))
+             cards.append(RECOMMENDED_CARD_TEMPLATE.format(url=escape(url), icon=icon, tag=escape(tag), title=escape(title), date=escape(date)).strip())
+
+        article.append(parse_fragment(RECOMMENDED_TEMPLATE.format(cards=''.join(cards))))
 
-        article.append(rec_soup)
+    @staticmethod
+    def _blog_app_entry(p):
+        """One BLOG_DATA record: the fields the blog app's cards and filters read."""
+        title = p.get('title', 'Untitled').split(" - ")[0]
+        return {
+            "title": title, "desc": shorten(p.get('description', ''), 60),
+            "url": p.get('url', '#').replace("https://cursor-vip.pro", "") or "/",
+            "date": p.get('date', ''), "tag": p.get('tag', 'Tech'), "icon": icon_for_title(title)
+        }
 
     def inject_blog_app(self, posts):
-        container = self.soup.find(id="blog-posts-container")
+        # One walk finds the container, the old category nav/pagination and any old app script
+        by_id = {}
+        existing_scripts = []
+        for tag in BLOG_APP_SELECTOR.iselect(self.soup):
+            if tag.name == 'script': existing_scripts.append(tag)
+            else: by_id.setdefault(tag['id'], tag)
+
+        container = by_id.get("blog-posts-container")
         if not container: return
         
-        existing_scripts = self.soup.find_all('script')
         for script in existing_scripts:
             if script.string and ('const BLOG_DATA' in script.string or 'const BLOG_TAGS' in script.string):
                 script.decompose()
         
         container.clear()
         
-        posts_data = []
-        tags = set()
-        
-        for p in posts:
-            if p['url'].endswith('/index') or 'index.html' in p['url']: continue
-            
-            title = p.get('title', 'Untitled').split(" - ")[0]
-            desc = p.get('description', '')[:60] + '...' if len(p.get('description', '')) > 60 else p.get('description', '')
-            url = p.get('url', '#').replace("https://cursor-vip.pro", "") or "/"
-            date = p.get('date', '')
-            tag = p.get('tag', 'Tech')
-            if tag: tags.add(tag)
-            icon = self._get_icon(title)
-            
-            posts_data.append({
-                "title": title, "desc": desc, "url": url,
-                "date": date, "tag": tag, "icon": icon
-            })
-            
-        sorted_tags = sorted(list(tags))
+        posts_data = [self._blog_app_entry(p) for p in posts if p['is_article']]
+        sorted_tags = sorted({post['tag'] for post in posts_data if post['tag']})
 
         # --- Pre-render Category Nav ---
-        cat_buttons = [f'<button onclick="window.setCategory(\'全部\')" class="px-4 py-2 rounded-full text-sm font-medium transition bg-blue-600 text-white shadow-lg shadow-blue-500/25">全部</button>']
-        for tag in sorted_tags:
-             cat_buttons.append(f'<button onclick="window.setCategory(\'{tag}\')" class="px-4 py-2 rounded-full text-sm font-medium transition bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5">{tag}</button>')
+        cat_buttons = '<button onclick="window.setCategory(\'全部\')" class="px-4 py-2 rounded-full text-sm font-medium transition bg-blue-600 text-white shadow-lg shadow-blue-500/25">全部</button>' + ''.join(
+            f'<button onclick="window.setCategory(\'{tag}\')" class="px-4 py-2 rounded-full text-sm font-medium transition bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5">{tag}</button>'
+            for tag in sorted_tags)
         
-        cat_nav = self.soup.find(id="category-nav")
+        cat_nav = by_id.get("category-nav")
         if cat_nav: cat_nav.decompose()
-        cat_html = f'<div id="category-nav" class="flex flex-wrap gap-2 mb-12 justify-center">{"".join(cat_buttons)}</div>'
-        container.insert_before(BeautifulSoup(cat_html, 'html.parser'))
+        cat_html = f'<div id="category-nav" class="flex flex-wrap gap-2 mb-12 justify-center">{cat_buttons}</div>'
+        container.insert_before(parse_fragment(cat_html))
         
         # --- Pre-render Posts (Page 1) ---
         posts_per_page = 6
         page_1_posts = posts_data[:posts_per_page]
         
         if not page_1_posts:
-             container.append(BeautifulSoup('<div class="col-span-full text-center text-slate-500 py-20">暂无文章</div>', 'html.parser'))
+             container.append(parse_fragment('<div class="col-span-full text-center text-slate-500 py-20">暂无文章</div>'))
         else:
-             for post in page_1_posts:
-                 card_html = f"""
-                 <a href="{post['url']}" class="block group">
-                  <article class="glass-card h-full rounded-2xl overflow-hidden flex flex-col">
-                   <div class="h-48 bg-slate-900/50 relative overflow-hidden">
-                    <div class="absolute inset-0 bg-gradient-to-br from-blue-900/40 to-slate-900"></div>
-                    <div class="absolute inset-0 flex items-center justify-center">
-                     <i class="fa-solid {post['icon']} text-6xl text-blue-500/20 group-hover:text-blue-500/40 transition duration-500"></i>
-                    </div>
-                    <div class="absolute top-4 left-4">
-                     <span class="px-3 py-1 rounded-full bg-blue-500/20 border border-blue-500/20 text-blue-300 text-xs font-mono">{post['tag']}</span>
-                    </div>
-                   </div>
-                   <div class="p-6 flex flex-col flex-grow">
-                    <h2 class="text-xl font-bold text-white mb-3 group-hover:text-blue-400 transition">{post['title']}</h2>
-                    <p class="text-sm text-slate-400 leading-relaxed mb-6 flex-grow">{post['desc']}</p>
-                    <div class="flex items-center justify-between text-xs text-slate-500 border-t border-white/5 pt-4">
-                     <div class="flex items-center gap-2"><i class="fa-regular fa-calendar"></i><span>{post['date']}</span></div>
-                     <div class="flex items-center gap-1 group-hover:translate-x-1 transition"><span>阅读全文</span><i class="fa-solid fa-arrow-right"></i></div>
-                    </div>
-                   </div>
-                  </article>
-                 </a>
-                 """
-                 container.append(BeautifulSoup(card_html, 'html.parser'))
+             cards = ''.join(BLOG_CARD_TEMPLATE.format_map({k: escape(v) for k, v in post.items()}) for post in page_1_posts)
+             container.extend(parse_fragments(cards))
 
         # --- Pre-render Pagination ---
-        pag_nav = self.soup.find(id="pagination")
+        pag_nav = by_id.get("pagination")
         if pag_nav: pag_nav.decompose()
         
         total_pages = math.ceil(len(posts_data) / posts_per_page)
@@ -587,112 +876,12 @@ class ContentInjector:
             pag_inner_html += f'<button onclick="window.setPage(2)" class="w-10 h-10 flex items-center justify-center rounded-full bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5 transition"><i class="fa-solid fa-chevron-right text-xs"></i></button>'
 
         pag_html = f'<div id="pagination" class="flex justify-center items-center gap-2 mt-16">{pag_inner_html}</div>'
-        container.insert_after(BeautifulSoup(pag_html, 'html.parser'))
-            
-        script_content = f"""
-        const BLOG_DATA = {json.dumps(posts_data, ensure_ascii=False)};
-        const BLOG_TAGS = {json.dumps(sorted_tags, ensure_ascii=False)};
-        
-        (function() {{
-            const postsPerPage = 6;
-            let currentPage = 1;
-            let currentCategory = '全部';
-            const container = document.getElementById('blog-posts-container');
-            const catNav = document.getElementById('category-nav');
-            const pagNav = document.getElementById('pagination');
-            
-            function initState() {{
-                const params = new URLSearchParams(window.location.search);
-                currentCategory = params.get('category') || '全部';
-                currentPage = parseInt(params.get('page')) || 1;
-                render();
-            }}
-            
-            function render() {{
-                const filtered = currentCategory === '全部' ? BLOG_DATA : BLOG_DATA.filter(p => p.tag === currentCategory);
-                const totalPages = Math.ceil(filtered.length / postsPerPage);
-                if (currentPage > totalPages) currentPage = 1;
-                if (currentPage < 1) currentPage = 1;
-                
-                const start = (currentPage - 1) * postsPerPage;
-                const pagePosts = filtered.slice(start, start + postsPerPage);
-                
-                renderPosts(pagePosts);
-                renderCategories();
-                renderPagination(totalPages);
-                
-                const newUrl = new URL(window.location);
-                if (currentCategory !== '全部') newUrl.searchParams.set('category', currentCategory);
-                else newUrl.searchParams.delete('category');
-                if (currentPage > 1) newUrl.searchParams.set('page', currentPage);
-                else newUrl.searchParams.delete('page');
-                window.history.replaceState({{}}, '', newUrl);
-            }}
-            
-            function renderPosts(posts) {{
-                if (posts.length === 0) {{
-                    container.innerHTML = '<div class="col-span-full text-center text-slate-500 py-20">暂无文章</div>';
-                    return;
-                }}
-                container.innerHTML = posts.map(post => `
-                    <a href="${{post.url}}" class="block group">
-                      <article class="glass-card h-full rounded-2xl overflow-hidden flex flex-col">
-                       <div class="h-48 bg-slate-900/50 relative overflow-hidden">
-                        <div class="absolute inset-0 bg-gradient-to-br from-blue-900/40 to-slate-900"></div>
-                        <div class="absolute inset-0 flex items-center justify-center">
-                         <i class="fa-solid ${{post.icon}} text-6xl text-blue-500/20 group-hover:text-blue-500/40 transition duration-500"></i>
-                        </div>
-                        <div class="absolute top-4 left-4">
-                         <span class="px-3 py-1 rounded-full bg-blue-500/20 border border-blue-500/20 text-blue-300 text-xs font-mono">${{post.tag}}</span>
-                        </div>
-                       </div>
-                       <div class="p-6 flex flex-col flex-grow">
-                        <h2 class="text-xl font-bold text-white mb-3 group-hover:text-blue-400 transition">${{post.title}}</h2>
-                        <p class="text-sm text-slate-400 leading-relaxed mb-6 flex-grow">${{post.desc}}</p>
-                        <div class="flex items-center justify-between text-xs text-slate-500 border-t border-white/5 pt-4">
-                         <div class="flex items-center gap-2"><i class="fa-regular fa-calendar"></i><span>${{post.date}}</span></div>
-                         <div class="flex items-center gap-1 group-hover:translate-x-1 transition"><span>阅读全文</span><i class="fa-solid fa-arrow-right"></i></div>
-                        </div>
-                       </div>
-                      </article>
-                    </a>
-                `).join('');
-            }}
-            
-            function renderCategories() {{
-                const allActive = currentCategory === '全部' ? 'bg-blue-600 text-white shadow-lg shadow-blue-500/25' : 'bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5';
-                let html = `<button onclick="window.setCategory('全部')" class="px-4 py-2 rounded-full text-sm font-medium transition ${{allActive}}">全部</button>`;
-                BLOG_TAGS.forEach(tag => {{
-                    const isActive = currentCategory === tag;
-                    const cls = isActive ? 'bg-blue-600 text-white shadow-lg shadow-blue-500/25' : 'bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5';
-                    html += `<button onclick="window.setCategory('${{tag}}')" class="px-4 py-2 rounded-full text-sm font-medium transition ${{cls}}">${{tag}}</button>`;
-                }});
-                catNav.innerHTML = html;
-            }}
-            
-            function renderPagination(totalPages) {{
-                if (totalPages <= 1) {{ pagNav.innerHTML = ''; return; }}
-                let html = '';
-                if (currentPage > 1) html += `<button onclick="window.setPage(${{currentPage - 1}})" class="w-10 h-10 flex items-center justify-center rounded-full bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5 transition"><i class="fa-solid fa-chevron-left text-xs"></i></button>`;
-                for (let i = 1; i <= totalPages; i++) {{
-                    if (i === 1 || i === totalPages || (i >= currentPage - 1 && i <= currentPage + 1)) {{
-                        const isActive = i === currentPage;
-                        const cls = isActive ? 'bg-blue-600 text-white shadow-lg shadow-blue-500/25' : 'bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5';
-                        html += `<button onclick="window.setPage(${{i}})" class="w-10 h-10 flex items-center justify-center rounded-full text-sm font-medium transition ${{cls}}">${{i}}</button>`;
-                    }} else if (i === 2 && currentPage > 3) html += '<span class="w-10 h-10 flex items-center justify-center text-slate-600">...</span>';
-                    else if (i === totalPages - 1 && currentPage < totalPages - 2) html += '<span class="w-10 h-10 flex items-center justify-center text-slate-600">...</span>';
-                }}
-                if (currentPage < totalPages) html += `<button onclick="window.setPage(${{currentPage + 1}})" class="w-10 h-10 flex items-center justify-center rounded-full bg-slate-800/50 text-slate-400 hover:bg-slate-800 hover:text-white border border-white/5 transition"><i class="fa-solid fa-chevron-right text-xs"></i></button>`;
-                pagNav.innerHTML = html;
-            }}
+        container.insert_after(parse_fragment(pag_html))
             
-            window.setCategory = (cat) => {{ currentCategory = cat; currentPage = 1; render(); }};
-            window.setPage = (p) => {{ currentPage = p; render(); document.getElementById('category-nav').scrollIntoView({{ behavior: 'smooth' }}); }};
-            
-            initState();
-            window.addEventListener('popstate', initState);
-        }})();
-        """
+        script_content = BLOG_APP_SCRIPT_TEMPLATE.format(
+            blog_data=dump_schema(posts_data),
+            blog_tags=dump_schema(sorted_tags),
+        )
         script_tag = self.soup.new_tag('script')
         script_tag.string = script_content
         self.soup.body.append(script_tag)
@@ -701,31 +890,16 @@ class ContentInjector:
         container = self.soup.find(id="latest-posts-container")
         if not container: return
         container.clear()
+        if not posts: return
+        cards = []
         for post in posts[:6]:
             title = post.get('title', 'Untitled')
-            desc = post.get('description', '')[:60] + '...' if len(post.get('description', '')) > 60 else post.get('description', '')
+            desc = shorten(post.get('description', ''), 60)
             url = post.get('url', '#').replace("https://cursor-vip.pro", "") or "/"
             date = post.get('date', '')
             tag = post.get('tag', 'Tech')
-            html = f"""
-            <a href="{url}" class="block group">
-             <article class="glass-card h-full rounded-2xl overflow-hidden flex flex-col bg-[#0B0F19] border border-white/10 hover:border-blue-500/30 transition duration-300">
-              <div class="p-6 flex flex-col flex-grow">
-               <div class="flex items-center justify-between mb-4">
-                <span class="px-3 py-1 rounded-full bg-blue-500/10 border border-blue-500/20 text-blue-400 text-xs font-mono">{tag}</span>
-                <span class="text-xs text-slate-500 font-mono">{date}</span>
-               </div>
-               <h3 class="text-lg font-bold text-white mb-3 group-hover:text-blue-400 transition line-clamp-2">{title}</h3>
-               <p class="text-sm text-slate-400 leading-relaxed mb-6 flex-grow line-clamp-3">{desc}</p>
-               <div class="flex items-center gap-2 text-xs text-slate-500 group-hover:text-blue-400 transition mt-auto">
-                <span>Read Article</span>
-                <i class="fa-solid fa-arrow-right group-hover:translate-x-1 transition-transform"></i>
-               </div>
-              </div>
-             </article>
-            </a>
-            """
-            container.append(BeautifulSoup(html, 'html.parser'))
+            cards.append(LATEST_POST_CARD_TEMPLATE.format(url=escape(url), tag=escape(tag), date=escape(date), title=escape(title), desc=escape(desc)))
+        container.extend(parse_fragments(''.join(cards)))
 
 class SitemapGenerator:
     def __init__(self, base_url="https://cursor-vip.pro"):
@@ -733,15 +907,22 @@ class SitemapGenerator:
         self.urls = []
 
     def add_url(self, url, priority=0.8, lastmod=None):
-        if not lastmod: lastmod = datetime.date.today().isoformat()
+        if not lastmod: lastmod = BUILD_DATE
         self.urls.append({"loc": url, "lastmod": lastmod, "priority": priority})
 
+    SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
     def generate(self, output_path):
-        xml = ['<?xml version="1.0" encoding="UTF-8"?>', '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+        # lxml builds and escapes the document in C (URLs containing & stay valid XML)
+        urlset = etree.Element('urlset', nsmap={None: self.SITEMAP_NS})
         for u in self.urls:
-            xml.append(f'  <url>\n    <loc>{u["loc"]}</loc>\n    <lastmod>{u["lastmod"]}</lastmod>\n    <changefreq>weekly</changefreq>\n    <priority>{u["priority"]}</priority>\n  </url>')
-        xml.append('</urlset>')
-        with open(output_path, 'w', encoding='utf-8') as f: f.write('\n'.join(xml))
+            url_el = etree.SubElement(urlset, 'url')
+            etree.SubElement(url_el, 'loc').text = u['loc']
+            etree.SubElement(url_el, 'lastmod').text = u['lastmod']
+            etree.SubElement(url_el, 'changefreq').text = 'weekly'
+            etree.SubElement(url_el, 'priority').text = str(u['priority'])
+        xml = b'<?xml version="1.0" encoding="UTF-8"?>\n' + etree.tostring(urlset, encoding='utf-8', pretty_print=True).rstrip(b'\n')
+        write_if_changed(output_path, xml)
 
 class RobotsGenerator:
     def __init__(self, base_url="https://cursor-vip.pro"):
@@ -749,7 +930,185 @@ class RobotsGenerator:
 
     def generate(self, output_path):
         content = f"User-agent: *\nAllow: /\n\nSitemap: {self.base_url}/sitemap.xml\n"
-        with open(output_path, 'w', encoding='utf-8') as f: f.write(content)
+        write_if_changed(output_path, content.encode('utf-8'))
+
+# ==========================================
+# Build Steps
+# ==========================================
+
+def extract_page(post_path):
+    """
+    Phase 1 (runs in a worker process): parses one page and extracts its metadata.
+    Returns (post, item): the entry for the site-wide post list and the render job for phase 2.
+    """
+    is_index = os.path.basename(post_path) == 'index.html'
+    # Read-only pass: plain lxml is far cheaper than building a BeautifulSoup tree
+    with open(post_path, 'rb') as f:
+        raw = f.read()
+    fields = find_page_fields(lxml.html.document_fromstring(raw, parser=PAGE_PARSER))
+
+    title_tag_find = fields['title']
+    title = title_tag_find[0].text_content().strip() if title_tag_find else "Untitled"
+    title = TITLE_YEAR_RE.sub('', TITLE_NUMBER_RE.sub('', title.replace(TITLE_SUFFIX, '')))
+
+    desc_tag = fields['description']
+    description = desc_tag[0].get('content', '') if desc_tag else DEFAULT_DESCRIPTION
+
+    filename = os.path.basename(post_path)
+    if BLOG_DIR in post_path:
+        url = f"https://cursor-vip.pro/blog/{filename.replace('.html', '')}"
+        page_type = 'blog'
+    else:
+        if is_index:
+            url = "https://cursor-vip.pro/"
+            page_type = 'home'
+        else:
+            url = f"https://cursor-vip.pro/{filename.replace('.html', '')}"
+            page_type = 'static'
+
+    metadata = {"title": title, "description": description, "keywords": DEFAULT_KEYWORDS, "url": url, "type": page_type}
+
+    # Date extraction
+    # Priority 1: Meta Tag "article:published_time" (Manual Control) - Highest Priority
+    # Priority 2: JSON-LD "datePublished" (Manual Control)
+    # Priority 3: Git Creation Date (Historical Reality)
+    # Priority 4: Today (Fallback)
+
+    date_published = None
+
+    # 1. Check Meta Tag (Manual Override)
+    meta_date = fields['published_time']
+    if meta_date and meta_date[0].get('content'):
+        date_published = meta_date[0].get('content')
+
+    # 2. Check JSON-LD (if not found in meta); a byte search rules out most pages before any JSON is parsed
+    if not date_published and b'"datePublished"' in raw:
+        for script in fields['json_ld']:
+            if not script.text: continue
+            try:
+                data = load_schema(script.text)
+            except ValueError: # Malformed block (orjson.JSONDecodeError is a ValueError too)
+                continue
+            for entry in (data if isinstance(data, list) else [data]):
+                if isinstance(entry, dict) and entry.get('datePublished'):
+                    date_published = entry['datePublished']
+                    break
+            if date_published: break
+
+    # 3. Fallback to Git Creation Date
+    if not date_published:
+         date_published = get_post_date(post_path, _worker_context['git_dates'])
+
+    # Get Last Modified Date for Sitemap
+    date_modified = get_last_modified_date(post_path, _worker_context['git_dates'])
+
+    # 4. Git History Check (Smart Suppression)
+    # If Git Last Modified is '2026-02-03' or '2026-02-04' (Batch Fix Dates),
+    # AND the article is older than Feb 1st, suppress the modification date in Sitemap.
+    # This ensures sitemap looks historically accurate for old posts,
+    # while allowing FUTURE updates (after Feb 5th) to trigger a new lastmod.
+
+    if date_modified in ['2026-02-03', '2026-02-04', '2026-02-11', '2026-02-12', '2026-02-13']:
+        try:
+            # If published before Feb 15th (covering all current articles), and modified in batch fix window -> use published date
+            # (compare dates, so an aware timestamp does not meet a naive datetime)
+            if parse_date(date_published).date() < datetime.date(2026, 2, 15):
+                date_modified = date_published
+        except (ValueError, TypeError):
+            pass
+
+    tag = DEFAULT_TAG
+    tag_elem = fields['tag_badge']
+    if tag_elem:
+        raw_tag = tag_elem[0].text_content().strip()
+        tag = TAG_MAPPING.get(raw_tag, raw_tag)
+
+    metadata["date"] = date_published
+    metadata["author"] = "Cursor-VIP Team"
+    post = {"title": title, "description": description, "url": url, "date": date_published, "lastmod": date_modified, "tag": tag, "type": page_type,
+            # Classified here once so main() sorts and filters with plain key lookups
+            "is_article": page_type == 'blog' and not url.endswith('/index') and 'index.html' not in url,
+            "sort_key": post_sort_key(url, date_published)}
+    item = {"path": post_path, "metadata": metadata, "is_index": is_index, "page_type": page_type, "date_published": date_published, "title": title,
+            "digest": hashlib.sha256(raw).hexdigest()} # Current file bytes, compared with the cache to detect edits
+    return post, item
+
+def post_sort_key(url, date):
+    """Sitemap order: home, blog index, blog posts, static pages; newest first within each group."""
+    if url == "https://cursor-vip.pro/": type_order = 0
+    elif url == "https://cursor-vip.pro/blog/" or url.endswith("/blog/index"): type_order = 1
+    elif "/blog/" in url: type_order = 2
+    else: type_order = 3
+    try:
+        timestamp = parse_date(date).timestamp()
+    except: timestamp = 0
+    return (type_order, -timestamp)
+
+def find_page_fields(doc):
+    """Sorts the PAGE_FIELDS_XPATH matches by field; each list is in document order."""
+    fields = {'title': [], 'description': [], 'published_time': [], 'json_ld': [], 'tag_badge': []}
+    for el in PAGE_FIELDS_XPATH(doc):
+        if el.tag == 'meta':
+            if el.get('name') == 'description': fields['description'].append(el)
+            if el.get('property') == 'article:published_time': fields['published_time'].append(el)
+        elif el.tag == 'title': fields['title'].append(el)
+        elif el.tag == 'script': fields['json_ld'].append(el)
+        else: fields['tag_badge'].append(el)
+    return fields
+
+def splice_layout(output, nav, footer):
+    """Replaces the nav/footer markers in a serialized page with the shared HTML from index.html."""
+    if nav:
+        output = output.replace(f'<!--{NAV_MARKER}-->'.encode(), nav.encode('utf-8'), 1)
+    if footer:
+        output = output.replace(f'<!--{FOOTER_MARKER}-->'.encode(), footer.encode('utf-8'), 1)
+    return output
+
+# Per-process state installed by the pool initializer: the nav/footer/favicon strings
+# extracted from index.html and the git history dates reach each worker once instead of with every task
+_worker_context = {}
+
+def _init_worker(context):
+    global _worker_context
+    _worker_context = context
+
+def render_page(item, blog_posts):
+    """Phase 2 (runs in a worker process): rebuilds one page's head, nav/footer and injected blocks, then writes it."""
+    nav = _worker_context['nav']
+    footer = _worker_context['footer']
+    favicons = _worker_context['favicons']
+    # Pages are re-parsed here rather than shipping soups between processes
+    soup = parse_page(item['path'])
+    SmartExtractor._standardize_links(soup)
+
+    reconstructor = HeadReconstructor(soup, item['metadata'], favicons)
+    reconstructor.reconstruct()
+    injector = ContentInjector(soup)
+    injector.inject_nav(nav)
+    injector.inject_footer(footer)
+    
+    if item['is_index'] and item['page_type'] == 'home':
+         injector.inject_latest_posts(blog_posts)
+    elif item['is_index'] and item['page_type'] == 'blog':
+         injector.inject_breadcrumbs("博客", is_blog_index=True)
+         injector.inject_blog_app(blog_posts)
+    elif not item['is_index']:
+         if item['page_type'] == 'blog':
+             injector.inject_breadcrumbs(item['title'])
+             injector.inject_article_meta(item['date_published'])
+             injector.inject_recommended(blog_posts, item['metadata']['url'])
+         else:
+             injector.inject_recommended(blog_posts, item['metadata']['url'])
+
+    # Plain serialization preserves formatting and skips the indenter; PRETTY=1 opts into prettify() for debugging
+    output = soup.prettify(encoding='utf-8') if PRETTY_OUTPUT else soup.encode(formatter='minimal')
+    output = splice_layout(output, nav, footer)
+    digest = hashlib.sha256(output).hexdigest()
+    # Write-if-changed: phase 1 already hashed the bytes on disk, so no second read is needed
+    if digest != item['digest']:
+        with open(item['path'], 'wb') as f:
+            f.write(output)
+    return item['path'], digest
 
 def main():
     print("🚀 Starting Build Process...")
@@ -764,155 +1123,70 @@ def main():
     favicons = extractor.get_favicons()
     
     if not os.path.exists(BLOG_DIR): os.makedirs(BLOG_DIR, exist_ok=True)
-    blog_files = glob.glob(os.path.join(BLOG_DIR, '*.html'))
+    # One scandir per directory instead of glob plus an exists() stat per static page
+    with os.scandir(BLOG_DIR) as entries:
+        blog_files = [e.path for e in entries
+                      if e.name.endswith('.html') and not e.name.startswith('.') and e.is_file()]
     static_pages = ['index.html', 'about.html', 'privacy.html', 'terms.html', 'refund.html']
-    root_files = [os.path.join(ROOT_DIR, f) for f in static_pages if os.path.exists(os.path.join(ROOT_DIR, f))]
+    with os.scandir(ROOT_DIR) as entries:
+        root_entries = {e.name: e.path for e in entries if e.is_file()}
+    root_files = [root_entries[f] for f in static_pages if f in root_entries]
     all_files = blog_files + root_files
     print(f"📂 Found {len(all_files)} files to process.")
 
     latest_posts = []
     processed_files = []
 
-    for post_path in all_files:
-        is_index = os.path.basename(post_path) == 'index.html'
-        with open(post_path, 'r', encoding='utf-8') as f: soup = BeautifulSoup(f, 'html.parser')
-        extractor._standardize_links(soup)
+    # Phase 1: extract metadata from every page in parallel (map keeps file order)
+    layout = {'nav': nav, 'footer': footer, 'favicons': favicons}
+    workers = os.cpu_count() or 1
+    # Batched tasks: each chunk pickles the shared post list once instead of once per page
+    chunksize = max(1, len(all_files) // (workers * 4))
+    cache = {} if FULL_BUILD else load_cache()
+    # Commit dates only change with new commits, so the last run's walk is reused while HEAD is the same
+    head = git_head()
+    if head and cache.get('git_head') == head:
+        git_dates = cache.get('git_dates', {})
+    else:
+        git_dates = load_git_dates()
+    context = dict(layout, git_dates=git_dates) # History is shipped to workers, not hashed into the cache key
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,)) as executor:
+        for post, item in executor.map(extract_page, all_files, chunksize=chunksize):
+            print(f"   📅 Date: {post['date']} (Published), {post['lastmod']} (Modified)")
+            latest_posts.append(post)
+            processed_files.append(item)
 
-        title_tag_find = soup.find('title')
-        title = title_tag_find.get_text().strip() if title_tag_find else "Untitled"
-        if " - Cursor-VIP.pro" in title: title = title.replace(" - Cursor-VIP.pro", "")
-        title = re.sub(r'^\d+[.、\s]*\s*', '', title)
-        title = re.sub(r'\s?202[0-9]\s?', '', title)
-            
-        desc_tag = soup.find('meta', attrs={"name": "description"})
-        description = desc_tag['content'] if desc_tag else "Cursor VIP Service."
-        
-        filename = os.path.basename(post_path)
-        if BLOG_DIR in post_path:
-            url = f"https://cursor-vip.pro/blog/{filename.replace('.html', '')}"
-            page_type = 'blog'
-        else:
-            if is_index:
-                url = "https://cursor-vip.pro/"
-                page_type = 'home'
+        # Phase 2: every page needs the full post list, so rendering starts once phase 1 is done.
+        # Listings and recommendations share one newest-first list of real posts, sorted here once.
+        blog_posts = [p for p in latest_posts if p['is_article']]
+        blog_posts.sort(key=itemgetter('date'), reverse=True)
+
+        # Source and output are the same file, so "unchanged" means: the bytes on disk are the
+        # ones the last build wrote, and nothing that went into rendering them has changed since
+        cached_pages = cache.get('pages', {})
+        build_digest = build_inputs_digest(layout, blog_posts)
+        pages = {}
+        pending = []
+        for item in processed_files:
+            rel_path = os.path.relpath(item['path'], ROOT_DIR)
+            inputs = page_inputs_digest(build_digest, item)
+            entry = cached_pages.get(rel_path)
+            if entry and entry.get('inputs') == inputs and entry.get('output') == item['digest']:
+                pages[rel_path] = entry
             else:
-                url = f"https://cursor-vip.pro/{filename.replace('.html', '')}"
-                page_type = 'static'
+                pages[rel_path] = {'inputs': inputs}
+                pending.append(item)
+        if len(pending) < len(processed_files):
+            print(f"⏭️ {len(processed_files) - len(pending)} unchanged pages skipped")
 
-        metadata = {"title": title, "description": description, "keywords": "cursor, ai, code editor", "url": url, "type": page_type}
-        
-        # Date extraction
-        # Priority 1: Meta Tag "article:published_time" (Manual Control) - Highest Priority
-        # Priority 2: JSON-LD "datePublished" (Manual Control)
-        # Priority 3: Git Creation Date (Historical Reality)
-        # Priority 4: Today (Fallback)
-        
-        date_published = None
-        
-        # 1. Check Meta Tag (Manual Override)
-        meta_date = soup.find('meta', property='article:published_time')
-        if meta_date and meta_date.get('content'):
-            date_published = meta_date['content']
-            
-        # 2. Check JSON-LD (if not found in meta)
-        if not date_published:
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_ld_scripts:
-                try:
-                    if script.string:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and data.get('datePublished'):
-                            date_published = data.get('datePublished')
-                        elif isinstance(data, list):
-                             for item in data:
-                                 if item.get('datePublished'):
-                                     date_published = item.get('datePublished')
-                                     break
-                    if date_published: break
-                except:
-                    pass
-        
-        # 3. Fallback to Git Creation Date
-        if not date_published:
-             date_published = get_post_date(post_path)
-             
-        # Get Last Modified Date for Sitemap
-        date_modified = get_last_modified_date(post_path)
-        
-        # 4. Git History Check (Smart Suppression)
-        # If Git Last Modified is '2026-02-03' or '2026-02-04' (Batch Fix Dates),
-        # AND the article is older than Feb 1st, suppress the modification date in Sitemap.
-        # This ensures sitemap looks historically accurate for old posts,
-        # while allowing FUTURE updates (after Feb 5th) to trigger a new lastmod.
-        
-        if date_modified in ['2026-02-03', '2026-02-04', '2026-02-11', '2026-02-12', '2026-02-13']:
-            try:
-                pub_dt = datetime.datetime.strptime(date_published, "%Y-%m-%d")
-                # If published before Feb 15th (covering all current articles), and modified in batch fix window -> use published date
-                if pub_dt < datetime.datetime(2026, 2, 15):
-                    date_modified = date_published
-            except:
-                pass
-             
-        print(f"   📅 Date: {date_published} (Published), {date_modified} (Modified)")
-        
-        tag = "技术干货"
-        tag_elem = soup.find(['span', 'div'], class_=lambda x: x and 'font-mono' in x and 'rounded-full' in x)
-        if tag_elem:
-            raw_tag = tag_elem.get_text().strip()
-            tag = TAG_MAPPING.get(raw_tag, raw_tag)
-
-        metadata["date"] = date_published
-        metadata["author"] = "Cursor-VIP Team"
-        latest_posts.append({"title": title, "description": description, "url": url, "date": date_published, "lastmod": date_modified, "tag": tag, "type": page_type})
-        processed_files.append({"path": post_path, "soup": soup, "metadata": metadata, "is_index": is_index, "page_type": page_type, "date_published": date_published, "title": title})
-
-    for item in processed_files:
-        print(f"⚙️ Processing {os.path.basename(item['path'])}...")
-        reconstructor = HeadReconstructor(item['soup'], item['metadata'], favicons, latest_posts)
-        reconstructor.reconstruct()
-        injector = ContentInjector(item['soup'])
-        injector.inject_nav(nav)
-        injector.inject_footer(footer)
-        
-        if item['is_index'] and item['page_type'] == 'home':
-             blog_posts = [p for p in latest_posts if p['type'] == 'blog' and not p['url'].endswith('/index') and 'index.html' not in p['url']]
-             blog_posts.sort(key=lambda x: x['date'], reverse=True)
-             injector.inject_latest_posts(blog_posts)
-        elif item['is_index'] and item['page_type'] == 'blog':
-             all_blog_posts = [p for p in latest_posts if p['type'] == 'blog' and not p['url'].endswith('/index') and 'index.html' not in p['url']]
-             all_blog_posts.sort(key=lambda x: x['date'], reverse=True)
-             injector.inject_breadcrumbs("博客", is_blog_index=True)
-             injector.inject_blog_app(all_blog_posts)
-        elif not item['is_index']:
-             if item['page_type'] == 'blog':
-                 injector.inject_breadcrumbs(item['title'])
-                 injector.inject_article_meta(item['date_published'])
-                 injector.inject_recommended(latest_posts, item['metadata']['url'])
-             else:
-                 injector.inject_recommended(latest_posts, item['metadata']['url'])
-
-        with open(item['path'], 'w', encoding='utf-8') as f:
-            # Using str() instead of prettify() to preserve formatting
-            f.write(str(item['soup']))
+        for path, digest in executor.map(render_page, pending, repeat(blog_posts), chunksize=chunksize):
+            pages[os.path.relpath(path, ROOT_DIR)]['output'] = digest
+            print(f"⚙️ Processed {os.path.basename(path)}")
+        save_cache({'pages': pages, 'git_head': head, 'git_dates': git_dates})
 
     print("📋 Latest Articles updated.")
     
-    def sort_key(post):
-        url = post['url']
-        if url == "https://cursor-vip.pro/": type_order = 0
-        elif url == "https://cursor-vip.pro/blog/" or url.endswith("/blog/index"): type_order = 1
-        elif "/blog/" in url: type_order = 2
-        else: type_order = 3
-        try:
-            date_str = post.get('date', '1970-01-01')
-            if 'T' in date_str: dt = datetime.datetime.fromisoformat(date_str)
-            else: dt = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-            timestamp = dt.timestamp()
-        except: timestamp = 0
-        return (type_order, -timestamp)
-
-    latest_posts.sort(key=sort_key)
+    latest_posts.sort(key=itemgetter('sort_key'))
     sitemap_gen = SitemapGenerator()
 
     for post in latest_posts:
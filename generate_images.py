@@ -1,5 +1,6 @@
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import os
+import functools
 
 ASSETS_DIR = 'assets'
 if not os.path.exists(ASSETS_DIR):
@@ -10,6 +11,25 @@ def create_gradient_circle(draw, center, radius, color):
     # Actually, we can just draw a circle on a separate layer and blur it
     pass
 
+# (large, sub, badge) font candidates, tried in order: macOS system fonts, then Arial by name
+FONT_CHOICES = [
+    (("/System/Library/Fonts/Supplemental/Arial Black.ttf", 100),
+     ("/System/Library/Fonts/Supplemental/Arial.ttf", 32),
+     ("/System/Library/Fonts/Supplemental/Courier New Bold.ttf", 20)),
+    (("Arial", 100), ("Arial", 32), ("Arial", 20)),
+]
+
+@functools.lru_cache(maxsize=None)
+def load_fonts():
+    # Parsed once per run and shared by every image that draws text
+    for choice in FONT_CHOICES:
+        try:
+            return tuple(ImageFont.truetype(path, size) for path, size in choice)
+        except (OSError, ImportError): # Missing font file, or Pillow built without FreeType
+            continue
+    default = ImageFont.load_default()
+    return default, default, default
+
 def generate_og_image():
     width, height = 1200, 630
     # Background
@@ -41,21 +61,7 @@ def generate_og_image():
         draw.line([(0, y), (width, y)], fill=grid_color, width=1)
         
     # Main Text
-    # Try to load a font, fall back to default if necessary
-    try:
-        # Try finding a system font or use default
-        font_large = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial Black.ttf", 100)
-        font_sub = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", 32)
-        font_badge = ImageFont.truetype("/System/Library/Fonts/Supplemental/Courier New Bold.ttf", 20)
-    except:
-        try:
-            font_large = ImageFont.truetype("Arial", 100)
-            font_sub = ImageFont.truetype("Arial", 32)
-            font_badge = ImageFont.truetype("Arial", 20)
-        except:
-            font_large = ImageFont.load_default()
-            font_sub = ImageFont.load_default()
-            font_badge = ImageFont.load_default()
+    font_large, font_sub, font_badge = load_fonts()
 
     # Draw Text centered
     text_main = "CURSOR-VIP"